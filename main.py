@@ -1,38 +1,259 @@
 #!/usr/bin/env python3
 """ImaLink Qt Frontend Application Entry Point"""
 
+import argparse
+import logging
+import os
 import sys
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from pathlib import Path
 
-from src.ui.main_window import MainWindow
+# PySide6 and src are imported in main()/_run(), not here: spawn and
+# forkserver workers (import preview pool) re-import this module as
+# __mp_main__ and must stay Qt-free and cheap to start
 
 
-def main():
-    """Main entry point"""
-    # Enable high DPI scaling
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+APP_VERSION = "1.0"
+
+# Platform plugins worth caching - never offscreen/minimal/vnc, which would
+# start the next normal run without a visible window
+WINDOWING_PLATFORMS = {"xcb", "wayland", "wayland-egl", "windows", "cocoa"}
+
+# Keep a module-level reference so the window is not garbage collected
+window = None
+
+
+def _create_splash():
+    """Create a minimal splash screen shown while MainWindow is built"""
+    from PySide6.QtWidgets import QSplashScreen
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QPixmap
+    from src.ui.palette import Palette
+
+    pixmap = QPixmap(400, 200)
+    pixmap.fill(Palette.BACKGROUND)
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        "Loading ImaLink...",
+        Qt.AlignHCenter | Qt.AlignVCenter,
+        Palette.TEXT
     )
+    return splash
+
+
+def _set_identity():
+    """Set application name, organization and version in one place"""
+    from PySide6.QtCore import QCoreApplication
+
+    QCoreApplication.setApplicationName("ImaLink")
+    QCoreApplication.setOrganizationName("ImaLink")
+    QCoreApplication.setApplicationVersion(APP_VERSION)
+
+
+def _platform_cache_path() -> Path:
+    """File remembering the Qt platform plugin used on the last run"""
+    from PySide6.QtCore import QStandardPaths
+
+    config_dir = QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)
+    return Path(config_dir) / "platform"
+
+
+def _apply_cached_platform():
+    """
+    Preselect the Qt platform plugin from the previous run so Qt skips
+    plugin autodetection.
     
-    # Create application
-    app = QApplication(sys.argv)
-    app.setApplicationName("ImaLink")
-    app.setOrganizationName("ImaLink")
-    
-    # Load global stylesheet if exists
+    The cache is keyed by XDG_SESSION_TYPE so switching between X11 and
+    Wayland sessions never forces a plugin that cannot connect. An
+    unreadable cache or an unknown plugin name is ignored.
+    """
+    if "QT_QPA_PLATFORM" in os.environ:
+        return  # Explicit user choice
+    cache_path = _platform_cache_path()
     try:
-        with open("resources/styles/main.qss", "r") as f:
-            app.setStyleSheet(f.read())
-    except FileNotFoundError:
-        pass  # Use default styling
-    
-    # Create and show main window
-    window = MainWindow()
-    window.show()
+        cached = cache_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return  # Missing or damaged - let Qt autodetect
+    session, _, platform = cached.strip().partition(":")
+    if platform in WINDOWING_PLATFORMS and session == os.environ.get("XDG_SESSION_TYPE", ""):
+        os.environ.setdefault("QT_QPA_PLATFORM", platform)
+
+
+def _save_platform(platform: str):
+    """Remember the Qt platform plugin for the next start"""
+    if platform not in WINDOWING_PLATFORMS:
+        return
+    cache_path = _platform_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(f"{os.environ.get('XDG_SESSION_TYPE', '')}:{platform}", encoding="utf-8")
+    except OSError:
+        pass  # Cache is an optimization only
+
+
+def _parse_args(argv):
+    """
+    Parse ImaLink command line options.
     
+    Qt's own options (-platform, -stylesheet, ...) are not passed through
+    implicitly; forward them explicitly with --qt-arg.
+    """
+    parser = argparse.ArgumentParser(description="ImaLink photo management")
+    parser.add_argument("--style", help="Qt widget style to use (e.g. Fusion)")
+    parser.add_argument(
+        "--no-qss",
+        action="store_true",
+        default=bool(os.environ.get("IMALINK_SKIP_QSS")),
+        help="Skip the global stylesheet (also IMALINK_SKIP_QSS=1)"
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as fork-server: preload the UI and start instances on --launch"
+    )
+    parser.add_argument(
+        "--launch",
+        action="store_true",
+        help="Start via a running fork-server (falls back to a normal start)"
+    )
+    parser.add_argument(
+        "--qt-arg",
+        action="append",
+        default=[],
+        metavar="ARG",
+        help="Pass an argument to Qt (repeatable, e.g. --qt-arg=-platform --qt-arg=xcb)"
+    )
+    return parser.parse_args(argv[1:])
+
+
+def main():
+    """Main entry point"""
+    # Bytecode and optional shared library prefetching - before PySide6 and src
+    import src.prefetch  # noqa: F401
+
+    # Imported first so startup timings are measured from (almost) process start
+    import src.ui.startup_profiler  # noqa: F401
+
+    args = _parse_args(sys.argv)
+
+    # Debug output from API client / import is off unless requested
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("IMALINK_DEBUG") else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s"
+    )
+
+    if args.serve:
+        from src import launcher
+        launcher.serve(lambda: _run(args))
+        return
+    if args.launch:
+        from src import launcher
+        if launcher.request_launch():
+            return
+
+    exit_code = _run(args)
+
+    if os.environ.get("IMALINK_CLEAN_EXIT"):
+        # Full interpreter shutdown (useful when debugging leaks on exit)
+        sys.exit(exit_code)
+
+    # Skip GC of every Qt object, __del__ chains and atexit handlers
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exit_code)
+
+
+def _run(args) -> int:
+    """Create the application, run the event loop and return its exit code"""
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt, QTimer, QCoreApplication
+    from PySide6.QtGui import QPixmapCache
+
+    from src.storage.settings import Settings
+    from src.ui.startup_profiler import Span, watch_first_paint, dump as dump_profile
+    from src.ui.stylesheet import load_stylesheet
+
+    # Trim Qt subsystems the app does not use (must happen before QApplication)
+    QCoreApplication.setAttribute(Qt.AA_DisableSessionManager, True)
+    QCoreApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+    if sys.platform.startswith("linux"):
+        os.environ.setdefault("QT_NO_GLIB", "1")  # Skip GLib event dispatcher
+
+    # High DPI scaling: Qt reads the rounding policy from the environment
+    # during QApplication init (user-provided value wins)
+    os.environ.setdefault("QT_SCALE_FACTOR_ROUNDING_POLICY", "PassThrough")
+
+    # Application identity is static - set once before construction so
+    # Qt derives settings/cache paths from it during init
+    _set_identity()
+    # Only an autodetected platform is cached - an explicit choice
+    # (QT_QPA_PLATFORM, --qt-arg=-platform) applies to this run only
+    explicit_platform = "QT_QPA_PLATFORM" in os.environ or any(
+        arg.startswith("-platform") for arg in args.qt_arg
+    )
+    _apply_cached_platform()
+
+    # Create application
+    with Span("QApplication.__init__"):
+        app = QApplication(sys.argv[:1] + args.qt_arg)
+    app.aboutToQuit.connect(dump_profile)
+
+    # Room for decoded thumbnails/previews (limit is in KB)
+    QPixmapCache.setCacheLimit(20 * 1024)
+
+    if args.style:
+        app.setStyle(args.style)
+
+    # Load global stylesheet if exists (otherwise use default styling)
+    if not args.no_qss:
+        with Span("stylesheet load"):
+            stylesheet = load_stylesheet()
+            if stylesheet:
+                app.setStyleSheet(stylesheet)
+
+    # Show splash immediately - MainWindow construction (views, token
+    # validation against backend) happens after the event loop starts
+    with Span("splash"):
+        splash = _create_splash()
+        splash.show()
+        app.processEvents()
+
+    def build_window():
+        """Create and show main window once the event loop is running"""
+        global window
+        # Imported lazily so the UI import graph (views, widgets, API
+        # client) is loaded while the splash is already on screen
+        with Span("MainWindow import"):
+            from src.ui.main_window import MainWindow
+
+        with Span("MainWindow.__init__"):
+            window = MainWindow()
+        watch_first_paint(window)
+
+        # Run the first layout pass off-screen, then reveal the window on the
+        # next event loop iteration so pending events are processed first
+        window.setAttribute(Qt.WA_DontShowOnScreen, True)
+        window.show()
+        QTimer.singleShot(0, reveal_window)
+
+    def reveal_window():
+        """Put the already laid out main window on screen"""
+        window.hide()
+        window.setAttribute(Qt.WA_DontShowOnScreen, False)
+        window.show()
+        splash.finish(window)
+
+    QTimer.singleShot(0, build_window)
+
     # Run application
-    sys.exit(app.exec())
+    exit_code = app.exec()
+
+    if exit_code == 0 and not explicit_platform:
+        _save_platform(app.platformName())
+
+    # Flush persistent state now - callers exit via os._exit, which skips
+    # Qt/Python teardown
+    Settings().sync()
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -0,0 +1,100 @@
+"""
+Circuit breaker for APIClient
+
+Stops sending requests while the backend is unreachable, so views that
+fire many requests (thumbnail grids, imports) fail immediately instead of
+each waiting for connect timeouts and retries.
+"""
+import logging
+import threading
+import time
+
+import requests
+
+
+log = logging.getLogger(__name__)
+
+# Responses that mean the backend (or the proxy in front of it) is down
+FAILURE_STATUSES = frozenset({408, 502, 503, 504})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while the circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    CLOSED -> OPEN -> HALF_OPEN circuit breaker.
+
+    CLOSED: requests pass; failure_threshold consecutive failures open it.
+    OPEN: requests raise CircuitOpenError until recovery_timeout has passed.
+    HALF_OPEN: one probe request passes (others are rejected); success
+    closes the circuit, failure opens it again.
+
+    Thread-safe - shared by all requests of one APIClient.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold: Consecutive failures before the circuit opens
+            recovery_timeout: Seconds to reject requests before probing again
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state (closed, open or half_open)"""
+        return self._state
+
+    def before_request(self):
+        """
+        Check whether a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a probe is running)
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            if (self._state == self.OPEN
+                    and time.monotonic() - self._opened_at >= self.recovery_timeout):
+                self._state = self.HALF_OPEN  # This request is the probe
+                return
+            raise CircuitOpenError("Backend unavailable - not sending request (circuit open)")
+
+    def record_success(self):
+        """Record a request that reached a working backend"""
+        with self._lock:
+            if self._state != self.CLOSED:
+                log.info("Backend reachable again - circuit closed")
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        """Record a connection error, timeout or unavailable response"""
+        with self._lock:
+            if self._state == self.OPEN:
+                return  # Request started before it opened - keep the recovery time
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                log.warning("Backend unavailable - circuit open for %.0fs",
+                            self.recovery_timeout)
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def record_response(self, status_code: int):
+        """Record a received response by its status code"""
+        if status_code in FAILURE_STATUSES:
+            self.record_failure()
+        else:
+            self.record_success()
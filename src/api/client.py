@@ -1,6 +1,164 @@
 """API Client for ImaLink backend communication"""
+import base64
+import copy
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Callable, Iterator, List, Set, Tuple
+
+from .circuit_breaker import FAILURE_STATUSES, CircuitBreaker, CircuitOpenError
+from .preview_cache import PreviewDiskCache
+
+
+# orjson is optional - much faster for large (EXIF-heavy) payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson is optional - streams large photo lists instead of parsing at once
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+log = logging.getLogger(__name__)
+
+# Connection pool size - covers parallel import workers and thumbnail loading
+POOL_SIZE = 32
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Hotpreviews kept in memory by get_hotpreview (~10 KB each)
+HOTPREVIEW_CACHE_SIZE = 4096
+
+# Seconds get_current_user serves its cached result
+CURRENT_USER_TTL = 300.0
+
+# Bytes of coldpreviews kept in memory by get_coldpreview (~100-300 KB each)
+COLDPREVIEW_CACHE_BYTES = 64 * 1024 * 1024
+
+# Parallel requests used by get_hotpreviews (well below POOL_SIZE)
+HOTPREVIEW_WORKERS = 16
+
+# Fields whose absence in a 422 means the backend did not read a multipart import
+MULTIPART_IMPORT_FIELDS = frozenset({"hotpreview", "metadata", "filename"})
+
+# Request bodies above this size are gzip-compressed (bulk import, opt-in)
+GZIP_MIN_SIZE = 64 * 1024
+
+# Bulk import responses that send the batch through import_photo() instead
+# (404/405: no bulk endpoint - remembered; others: this batch was rejected).
+# 400 stays a batch error - re-posting photo by photo would hide payload bugs.
+BULK_FALLBACK_STATUSES = frozenset({404, 405, 415, 422})
+
+# Seconds to establish a connection - fail fast when the backend is down
+CONNECT_TIMEOUT = 3.05
+
+# Default seconds to wait for response data (time between bytes, not total)
+READ_TIMEOUT = 30.0
+
+# Longest Retry-After wait honoured before a retry (requests run on the UI thread)
+MAX_RETRY_AFTER = 5.0
+
+# Endpoints sent exactly once - a retried login can trip rate-limit lockouts
+NO_RETRY_PATHS = ("/api/v1/auth/login", "/api/v1/auth/register")
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize request payload to UTF-8 JSON bytes"""
+    if orjson is not None:
+        # Accept non-str dict keys like stdlib json does
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _loads(content: bytes) -> Any:
+    """Parse JSON response body"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class _CappedRetry(Retry):
+    """
+    Retry that waits at most MAX_RETRY_AFTER seconds for Retry-After and
+    reports every failed attempt to the circuit breaker.
+    
+    The adapter only sees the outcome of the last attempt, so without this
+    one breaker failure would cost all retries and their backoff. Retrying
+    stops as soon as the circuit opens. Attempts recorded here are not
+    recorded again by the adapter (see _APIHTTPAdapter.send).
+    """
+    
+    def __init__(self, *args, breaker: Optional[CircuitBreaker] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.breaker = breaker
+    
+    def new(self, **kwargs) -> "_CappedRetry":
+        retry = super().new(**kwargs)
+        retry.breaker = self.breaker
+        return retry
+    
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None) -> "_CappedRetry":
+        # Recorded before super() raises for the last attempt
+        failed = error is not None or (response is not None and response.status in FAILURE_STATUSES)
+        if self.breaker is not None and failed:
+            self.breaker.record_failure()
+            if self.breaker.state == CircuitBreaker.OPEN:
+                raise MaxRetryError(_pool, url, CircuitOpenError(
+                    "Backend unavailable - not retrying request (circuit open)"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+class _APIHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that applies a default timeout to requests without one and
+    routes every request through the client's circuit breaker.
+    """
+    
+    def __init__(self, *args, timeout: Optional[Tuple[float, float]] = None,
+                 breaker: Optional[CircuitBreaker] = None, **kwargs):
+        self.timeout = timeout
+        self.breaker = breaker
+        super().__init__(*args, **kwargs)
+    
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        if self.breaker is None:
+            return super().send(request, timeout=timeout, **kwargs)
+        
+        # A _CappedRetry has already recorded every failure urllib3 passed to it
+        retry = self.max_retries if isinstance(self.max_retries, _CappedRetry) else None
+        self.breaker.before_request()
+        try:
+            response = super().send(request, timeout=timeout, **kwargs)
+        except Exception:
+            if retry is None:
+                self.breaker.record_failure()
+            raise
+        if retry is None or not retry.is_retry(request.method, response.status_code):
+            self.breaker.record_response(response.status_code)
+        return response
 
 
 class APIClient:
@@ -11,24 +169,156 @@ class APIClient:
     Authentication: JWT Bearer tokens
     """
     
-    def __init__(self, base_url: str = "https://api.trollfjell.com"):
+    def __init__(self, base_url: str = "https://api.trollfjell.com",
+                 multipart_import: Optional[bool] = None,
+                 http2: Optional[bool] = None,
+                 timeout: float = READ_TIMEOUT,
+                 gzip_requests: Optional[bool] = None):
+        """
+        Args:
+            base_url: Backend base URL
+            multipart_import: Send hotpreviews in import_photo as raw JPEG
+                multipart parts instead of base64 in JSON (requires backend
+                support). Defaults to IMALINK_MULTIPART_IMPORT env variable.
+            http2: Use HTTP/2 via httpx (multiplexes parallel requests on one
+                connection; falls back to requests if httpx[http2] is not
+                installed). Defaults to IMALINK_HTTP2 env variable.
+            timeout: Seconds to wait for response data before giving up, so
+                a hung backend cannot block callers forever (connecting is
+                limited to CONNECT_TIMEOUT)
+            gzip_requests: gzip-compress large bulk import bodies (requires
+                backend support for Content-Encoding: gzip requests).
+                Defaults to IMALINK_GZIP_REQUESTS env variable.
+        """
         self.base_url = base_url
         self.token: Optional[str] = None
+        # Auth-only headers for multipart uploads (requests sets Content-Type)
+        self._auth_headers: Dict[str, str] = {}
+        # Returned by _headers() - rebuilt only when the token changes
+        self._json_headers: Dict[str, str] = dict(JSON_HEADERS)
+        # (monotonic time fetched, user) from get_current_user, per token
+        self._current_user: Optional[Tuple[float, Dict[str, Any]]] = None
+        if multipart_import is None:
+            multipart_import = bool(os.environ.get("IMALINK_MULTIPART_IMPORT"))
+        self.multipart_import = multipart_import
+        if gzip_requests is None:
+            gzip_requests = bool(os.environ.get("IMALINK_GZIP_REQUESTS"))
+        self.gzip_requests = gzip_requests
+        if http2 is None:
+            http2 = bool(os.environ.get("IMALINK_HTTP2"))
+        self.timeout = timeout
+        # Fails requests immediately while the backend is unreachable
+        self.breaker = CircuitBreaker()
+        self.session = self._create_session(
+            http2, (CONNECT_TIMEOUT, timeout), self.breaker,
+            no_retry_urls=[f"{base_url}{path}" for path in NO_RETRY_PATHS]
+        )
+        # hothash -> hotpreview JPEG bytes, least recently used first
+        self._hotpreviews: "OrderedDict[str, bytes]" = OrderedDict()
+        self._hotpreviews_lock = threading.Lock()
+        # (hothash, width, height) -> coldpreview JPEG bytes, LRU first
+        self._coldpreviews: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._coldpreviews_size = 0
+        self._coldpreviews_lock = threading.Lock()
+        # Coldpreviews + ETags kept across restarts (revalidated on use)
+        self._coldpreview_disk = PreviewDiskCache()
+        # Cleared on first 404/405 from the bulk import endpoint
+        self._bulk_import_supported = True
+    
+    @staticmethod
+    def _create_session(http2: bool = False,
+                        timeout: Optional[Tuple[float, float]] = None,
+                        breaker: Optional[CircuitBreaker] = None,
+                        no_retry_urls: List[str] = ()):
+        """
+        Create HTTP session with persistent keep-alive connection pool.
+        
+        Reusing connections avoids a TCP + TLS handshake per request.
+        Failed connection attempts are retried for every method, since
+        nothing was sent yet. Read timeouts are never retried and raise
+        ReadTimeout right away. Responses are retried only for idempotent
+        requests (not POST/PATCH), with exponential backoff on gateway
+        errors and 429, waiting for Retry-After (at most MAX_RETRY_AFTER
+        seconds) when the server sends it. 401/403 are never retried.
+        Requests to no_retry_urls (login, register) are never retried, not
+        even their connection attempts.
+        The final response is still returned so raise_for_status() behaves
+        as before.
+        
+        Args:
+            http2: Return an httpx-backed HTTP2Session if available
+            timeout: Default (connect, read) timeout in seconds for requests
+                that don't pass their own
+            breaker: Circuit breaker checked and updated by every request
+            no_retry_urls: URL prefixes sent with a single attempt
+        """
+        if http2:
+            try:
+                from .http2 import HTTP2Session
+                return HTTP2Session(POOL_SIZE, timeout, breaker)
+            except ImportError:
+                log.warning("HTTP/2 requested but httpx[http2] is not installed - using HTTP/1.1")
+        
+        session = requests.Session()
+        retry = _CappedRetry(
+            total=3,
+            read=False,  # A stalled server would block the caller for every attempt
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            breaker=breaker
+        )
+        adapter = _APIHTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=retry,
+            timeout=timeout,
+            breaker=breaker
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        
+        # Longest matching prefix wins, so these override the adapter above
+        no_retry_adapter = _APIHTTPAdapter(max_retries=0, timeout=timeout, breaker=breaker)
+        for url in no_retry_urls:
+            session.mount(url, no_retry_adapter)
+        return session
     
     def set_token(self, token: str):
         """Set authentication token"""
         self.token = token
+        self._auth_headers = {"Authorization": f"Bearer {token}"}
+        self._json_headers = {**JSON_HEADERS, **self._auth_headers}
+        self._current_user = None
     
     def clear_token(self):
-        """Clear authentication token"""
+        """
+        Clear authentication token.
+        
+        Also drops what is cached in memory for the user (profile, hot- and
+        coldpreviews). The coldpreview disk cache is kept - this also runs
+        when the token cannot be verified (e.g. backend down at startup);
+        only logout() removes it.
+        """
         self.token = None
+        self._auth_headers = {}
+        self._json_headers = dict(JSON_HEADERS)
+        self._current_user = None
+        self.clear_thumbnail_cache(disk=False)
+    
+    def close(self):
+        """Close pooled keep-alive connections (call on application exit)"""
+        self.session.close()
     
     def _headers(self) -> Dict[str, str]:
-        """Get headers with auth token if available"""
-        headers = {"Content-Type": "application/json"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
+        """
+        Get headers with auth token if available.
+        
+        Returns the same dict on every call (requests and httpx copy it
+        into each request) - copy before modifying.
+        """
+        return self._json_headers
     
     # ========================================
     # AUTHENTICATION ENDPOINTS
@@ -54,9 +344,9 @@ class APIClient:
             "password": password,
             "display_name": display_name
         }
-        response = requests.post(url, json=data)
+        response = self.session.post(url, data=_dumps(data), headers=JSON_HEADERS)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def login(self, username: str, password: str) -> Dict[str, Any]:
         """
@@ -73,32 +363,47 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/auth/login"
         data = {"username": username, "password": password}
-        response = requests.post(url, json=data)
+        response = self.session.post(url, data=_dumps(data), headers=JSON_HEADERS)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     def get_current_user(self) -> Dict[str, Any]:
         """
         Get current user profile
         
         GET /api/v1/auth/me
+        
+        The result is cached for CURRENT_USER_TTL seconds (until the token
+        changes or the profile is updated), so startup and views asking
+        for the user don't each cost a request. Callers get their own copy,
+        so changing it never alters the cached profile.
         """
+        cached = self._current_user
+        if cached is not None and time.monotonic() - cached[0] < CURRENT_USER_TTL:
+            return copy.deepcopy(cached[1])
+        
         url = f"{self.base_url}/api/v1/auth/me"
-        response = requests.get(url, headers=self._headers())
+        response = self.session.get(url, headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        user = _loads(response.content)
+        self._current_user = (time.monotonic(), user)
+        return copy.deepcopy(user)
 
     def logout(self):
         """
         Logout (server-side)
         
         POST /api/v1/auth/logout
+        
+        Drops all cached previews, including the disk cache, so the next
+        account to log in on this machine cannot see them.
         """
         url = f"{self.base_url}/api/v1/auth/logout"
         try:
-            requests.post(url, headers=self._headers())
+            self.session.post(url, headers=self._headers())
         finally:
             self.clear_token()
+            self._coldpreview_disk.clear()
     
     # ========================================
     # USER MANAGEMENT ENDPOINTS
@@ -111,9 +416,9 @@ class APIClient:
         GET /api/v1/users/me
         """
         url = f"{self.base_url}/api/v1/users/me"
-        response = requests.get(url, headers=self._headers())
+        response = self.session.get(url, headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def update_user_profile(self, display_name: Optional[str] = None,
                            email: Optional[str] = None) -> Dict[str, Any]:
@@ -128,9 +433,10 @@ class APIClient:
             data["display_name"] = display_name
         if email:
             data["email"] = email
-        response = requests.put(url, json=data, headers=self._headers())
+        response = self.session.put(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        self._current_user = None
+        return _loads(response.content)
     
     def change_password(self, current_password: str, new_password: str) -> Dict[str, Any]:
         """
@@ -143,9 +449,9 @@ class APIClient:
             "current_password": current_password,
             "new_password": new_password
         }
-        response = requests.post(url, json=data, headers=self._headers())
+        response = self.session.post(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def delete_account(self):
         """
@@ -154,7 +460,7 @@ class APIClient:
         DELETE /api/v1/users/me
         """
         url = f"{self.base_url}/api/v1/users/me"
-        response = requests.delete(url, headers=self._headers())
+        response = self.session.delete(url, headers=self._headers())
         response.raise_for_status()
     
     # ========================================
@@ -178,9 +484,32 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/photos"
         params = {"offset": offset, "limit": limit}
-        response = requests.get(url, headers=self._headers(), params=params)
+        response = self.session.get(url, headers=self._headers(), params=params)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
+    
+    def iter_photos(self, offset: int = 0, limit: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate photos of one page (same request as get_photos)
+        
+        With ijson installed the response is parsed while it streams in,
+        so only one photo dict is alive at a time instead of the whole page.
+        
+        GET /api/v1/photos?offset=0&limit=100
+        
+        Yields:
+            Photo dicts from the "data" array
+        """
+        if ijson is None or not isinstance(self.session, requests.Session):
+            yield from self.get_photos(offset=offset, limit=limit).get("data", [])
+            return
+        
+        url = f"{self.base_url}/api/v1/photos"
+        params = {"offset": offset, "limit": limit}
+        with self.session.get(url, headers=self._headers(), params=params, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True  # Undo gzip/deflate transfer encoding
+            yield from ijson.items(response.raw, "data.item", use_float=True)
     
     def search_photos(self, query: Optional[str] = None, rating_min: Optional[int] = None,
                      rating_max: Optional[int] = None, taken_after: Optional[str] = None,
@@ -209,9 +538,9 @@ class APIClient:
         if author_id:
             data["author_id"] = author_id
         
-        response = requests.post(url, json=data, headers=self._headers())
+        response = self.session.post(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def get_photo(self, hothash: str) -> Dict[str, Any]:
         """
@@ -220,9 +549,64 @@ class APIClient:
         GET /api/v1/photos/{hothash}
         """
         url = f"{self.base_url}/api/v1/photos/{hothash}"
-        response = requests.get(url, headers=self._headers())
+        response = self.session.get(url, headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
+    
+    def photo_exists(self, hothash: str) -> bool:
+        """
+        Check if a photo exists without fetching it
+        
+        HEAD /api/v1/photos/{hothash} (falls back to GET if the backend
+        does not allow HEAD)
+        """
+        url = f"{self.base_url}/api/v1/photos/{hothash}"
+        response = self.session.head(url, headers=self._headers())
+        if response.status_code == 405:
+            response = self.session.get(url, headers=self._headers())
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        return True
+    
+    def existing_hothashes(self, hothashes: List[str],
+                           progress_callback: Optional[Callable[[int], None]] = None) -> Set[str]:
+        """
+        Check which photos already exist, in a single request
+        
+        POST /api/v1/photos/exists-batch (falls back to one photo_exists()
+        request per hothash if the backend does not provide it)
+        
+        The fallback runs serially - callers run this in a worker thread,
+        and a thread pool per call would compete with the import's own
+        requests for the POOL_SIZE connections.
+        
+        Args:
+            hothashes: Hothashes to check
+            progress_callback: Called with the number of hothashes checked
+                so far (in the calling thread)
+            
+        Returns:
+            Set of the given hothashes that exist on the backend
+        """
+        url = f"{self.base_url}/api/v1/photos/exists-batch"
+        response = self.session.post(
+            url, data=_dumps({"hothashes": hothashes}), headers=self._headers()
+        )
+        if response.status_code in (404, 405):
+            # One HEAD per hothash
+            existing = set()
+            for checked, hothash in enumerate(hothashes, 1):
+                if self.photo_exists(hothash):
+                    existing.add(hothash)
+                if progress_callback:
+                    progress_callback(checked)
+            return existing
+        response.raise_for_status()
+        existing = set(_loads(response.content)["exists"])
+        if progress_callback:
+            progress_callback(len(hothashes))
+        return existing
     
     def update_photo(self, hothash: str, rating: Optional[int] = None,
                     author_id: Optional[int] = None, gps_latitude: Optional[float] = None,
@@ -243,9 +627,9 @@ class APIClient:
         if gps_longitude is not None:
             data["gps_longitude"] = gps_longitude
         
-        response = requests.put(url, json=data, headers=self._headers())
+        response = self.session.put(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def delete_photo(self, hothash: str):
         """
@@ -254,8 +638,9 @@ class APIClient:
         DELETE /api/v1/photos/{hothash}
         """
         url = f"{self.base_url}/api/v1/photos/{hothash}"
-        response = requests.delete(url, headers=self._headers())
+        response = self.session.delete(url, headers=self._headers())
         response.raise_for_status()
+        self.invalidate_coldpreview(hothash)
     
     # ========================================
     # IMAGEFILE ENDPOINTS
@@ -272,9 +657,9 @@ class APIClient:
         params = {"offset": offset, "limit": limit}
         if photo_hothash:
             params["photo_hothash"] = photo_hothash
-        response = requests.get(url, headers=self._headers(), params=params)
+        response = self.session.get(url, headers=self._headers(), params=params)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def get_image_file(self, image_id: int) -> Dict[str, Any]:
         """
@@ -283,9 +668,9 @@ class APIClient:
         GET /api/v1/image-files/{image_id}
         """
         url = f"{self.base_url}/api/v1/image-files/{image_id}"
-        response = requests.get(url, headers=self._headers())
+        response = self.session.get(url, headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def get_hotpreview_from_image(self, image_id: int) -> bytes:
         """
@@ -297,7 +682,7 @@ class APIClient:
             JPEG bytes (300x300px)
         """
         url = f"{self.base_url}/api/v1/image-files/{image_id}/hotpreview"
-        response = requests.get(url, headers=self._headers())
+        response = self.session.get(url, headers=self._headers())
         response.raise_for_status()
         return response.content
     
@@ -328,9 +713,9 @@ class APIClient:
             data["gps_latitude"] = gps_latitude
             data["gps_longitude"] = gps_longitude
         
-        response = requests.post(url, json=data, headers=self._headers())
+        response = self.session.post(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def find_similar_images(self, image_id: int, threshold: float = 0.95) -> Dict[str, Any]:
         """
@@ -340,9 +725,9 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/image-files/similar/{image_id}"
         params = {"threshold": threshold}
-        response = requests.get(url, headers=self._headers(), params=params)
+        response = self.session.get(url, headers=self._headers(), params=params)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     # ========================================
     # AUTHOR ENDPOINTS
@@ -356,9 +741,9 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/authors"
         params = {"offset": offset, "limit": limit}
-        response = requests.get(url, headers=self._headers(), params=params)
+        response = self.session.get(url, headers=self._headers(), params=params)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def get_author(self, author_id: int) -> Dict[str, Any]:
         """
@@ -367,9 +752,9 @@ class APIClient:
         GET /api/v1/authors/{author_id}
         """
         url = f"{self.base_url}/api/v1/authors/{author_id}"
-        response = requests.get(url, headers=self._headers())
+        response = self.session.get(url, headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def create_author(self, name: str, email: Optional[str] = None,
                      bio: Optional[str] = None) -> Dict[str, Any]:
@@ -384,9 +769,9 @@ class APIClient:
             data["email"] = email
         if bio:
             data["bio"] = bio
-        response = requests.post(url, json=data, headers=self._headers())
+        response = self.session.post(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def update_author(self, author_id: int, name: Optional[str] = None,
                      bio: Optional[str] = None) -> Dict[str, Any]:
@@ -401,9 +786,9 @@ class APIClient:
             data["name"] = name
         if bio:
             data["bio"] = bio
-        response = requests.put(url, json=data, headers=self._headers())
+        response = self.session.put(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def delete_author(self, author_id: int):
         """
@@ -412,7 +797,7 @@ class APIClient:
         DELETE /api/v1/authors/{author_id}
         """
         url = f"{self.base_url}/api/v1/authors/{author_id}"
-        response = requests.delete(url, headers=self._headers())
+        response = self.session.delete(url, headers=self._headers())
         response.raise_for_status()
     
     # ========================================
@@ -440,9 +825,9 @@ class APIClient:
             data["description"] = description
         if author_id:
             data["author_id"] = author_id
-        response = requests.post(url, json=data, headers=self._headers())
+        response = self.session.post(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def get_import_session(self, import_id: int) -> Dict[str, Any]:
         """
@@ -451,9 +836,9 @@ class APIClient:
         GET /api/v1/import-sessions/{import_id}
         """
         url = f"{self.base_url}/api/v1/import-sessions/{import_id}"
-        response = requests.get(url, headers=self._headers())
+        response = self.session.get(url, headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def get_import_sessions(self, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
         """
@@ -476,12 +861,12 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/import-sessions/"
         params = {"offset": offset, "limit": limit}
-        print(f"DEBUG APIClient: GET {url} with params {params}")
-        response = requests.get(url, headers=self._headers(), params=params)
-        print(f"DEBUG APIClient: Response status {response.status_code}")
+        log.debug("GET %s with params %s", url, params)
+        response = self.session.get(url, headers=self._headers(), params=params)
+        log.debug("Response status %s", response.status_code)
         response.raise_for_status()
-        result = response.json()
-        print(f"DEBUG APIClient: Response JSON: {result}")
+        result = _loads(response.content)
+        log.debug("Response JSON: %s", result)
         return result
     
     def update_import_session(self, import_id: int, status: Optional[str] = None,
@@ -500,9 +885,9 @@ class APIClient:
             data["processed_files"] = processed_files
         if failed_files is not None:
             data["failed_files"] = failed_files
-        response = requests.patch(url, json=data, headers=self._headers())
+        response = self.session.patch(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def delete_import_session(self, import_id: int):
         """
@@ -511,7 +896,7 @@ class APIClient:
         DELETE /api/v1/import-sessions/{import_id}
         """
         url = f"{self.base_url}/api/v1/import-sessions/{import_id}"
-        response = requests.delete(url, headers=self._headers())
+        response = self.session.delete(url, headers=self._headers())
         response.raise_for_status()
     
     # ========================================
@@ -526,9 +911,9 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/photo-stacks"
         params = {"offset": offset, "limit": limit}
-        response = requests.get(url, headers=self._headers(), params=params)
+        response = self.session.get(url, headers=self._headers(), params=params)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def get_photo_stack(self, stack_id: int) -> Dict[str, Any]:
         """
@@ -537,9 +922,9 @@ class APIClient:
         GET /api/v1/photo-stacks/{stack_id}
         """
         url = f"{self.base_url}/api/v1/photo-stacks/{stack_id}"
-        response = requests.get(url, headers=self._headers())
+        response = self.session.get(url, headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def create_photo_stack(self, stack_type: str, cover_photo_hothash: str) -> Dict[str, Any]:
         """
@@ -556,9 +941,9 @@ class APIClient:
             "stack_type": stack_type,
             "cover_photo_hothash": cover_photo_hothash
         }
-        response = requests.post(url, json=data, headers=self._headers())
+        response = self.session.post(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def update_photo_stack(self, stack_id: int, stack_type: Optional[str] = None,
                            cover_photo_hothash: Optional[str] = None) -> Dict[str, Any]:
@@ -573,9 +958,9 @@ class APIClient:
             data["stack_type"] = stack_type
         if cover_photo_hothash:
             data["cover_photo_hothash"] = cover_photo_hothash
-        response = requests.put(url, json=data, headers=self._headers())
+        response = self.session.put(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def delete_photo_stack(self, stack_id: int):
         """
@@ -584,7 +969,7 @@ class APIClient:
         DELETE /api/v1/photo-stacks/{stack_id}
         """
         url = f"{self.base_url}/api/v1/photo-stacks/{stack_id}"
-        response = requests.delete(url, headers=self._headers())
+        response = self.session.delete(url, headers=self._headers())
         response.raise_for_status()
     
     def add_photo_to_stack(self, stack_id: int, photo_hothash: str) -> Dict[str, Any]:
@@ -595,9 +980,9 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/photo-stacks/{stack_id}/photo"
         data = {"photo_hothash": photo_hothash}
-        response = requests.post(url, json=data, headers=self._headers())
+        response = self.session.post(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def remove_photo_from_stack(self, stack_id: int, photo_hothash: str):
         """
@@ -606,7 +991,7 @@ class APIClient:
         DELETE /api/v1/photo-stacks/{stack_id}/photo/{photo_hothash}
         """
         url = f"{self.base_url}/api/v1/photo-stacks/{stack_id}/photo/{photo_hothash}"
-        response = requests.delete(url, headers=self._headers())
+        response = self.session.delete(url, headers=self._headers())
         response.raise_for_status()
     
     # ========================================
@@ -625,10 +1010,79 @@ class APIClient:
         Returns:
             JPEG image bytes (300x300px)
         """
+        # The hothash is the SHA256 of the hotpreview, so a cached copy can
+        # never be stale - serve it without a request
+        with self._hotpreviews_lock:
+            data = self._hotpreviews.get(hothash)
+            if data is not None:
+                self._hotpreviews.move_to_end(hothash)
+                return data
+        
         url = f"{self.base_url}/api/v1/photos/{hothash}/hotpreview"
-        response = requests.get(url, headers=self._headers())
+        response = self.session.get(url, headers=self._headers())
         response.raise_for_status()
-        return response.content
+        
+        data = response.content
+        with self._hotpreviews_lock:
+            self._hotpreviews[hothash] = data
+            if len(self._hotpreviews) > HOTPREVIEW_CACHE_SIZE:
+                self._hotpreviews.popitem(last=False)
+        return data
+    
+    def get_hotpreviews(self, hothashes: List[str],
+                        max_workers: int = HOTPREVIEW_WORKERS) -> Iterator[Tuple[str, Optional[bytes]]]:
+        """
+        Get hotpreviews for many photos, fetching them in parallel.
+        
+        Results are yielded as they arrive (not in input order), so the
+        caller can show thumbnails incrementally. Cached hotpreviews are
+        yielded without a request.
+        
+        Args:
+            hothashes: Photos' hothash identifiers
+            max_workers: Maximum number of requests in flight
+            
+        Yields:
+            (hothash, JPEG bytes) tuples - bytes is None if the fetch failed
+        """
+        if not hothashes:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(hothashes)))
+        try:
+            futures = {executor.submit(self.get_hotpreview, hothash): hothash
+                       for hothash in hothashes}
+            for future in as_completed(futures):
+                hothash = futures[future]
+                try:
+                    yield hothash, future.result()
+                except Exception as e:
+                    log.warning("Failed to load hotpreview %s: %s", hothash, e)
+                    yield hothash, None
+        finally:
+            # Don't fetch the rest if the caller stops iterating early
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def clear_thumbnail_cache(self, disk: bool = True):
+        """
+        Drop all cached hot- and coldpreviews.
+        
+        Args:
+            disk: Also remove the coldpreview disk cache
+        """
+        with self._hotpreviews_lock:
+            self._hotpreviews.clear()
+        with self._coldpreviews_lock:
+            self._coldpreviews.clear()
+            self._coldpreviews_size = 0
+        if disk:
+            self._coldpreview_disk.clear()
+    
+    def invalidate_coldpreview(self, hothash: str):
+        """Drop cached coldpreviews of a photo (all sizes, memory and disk)"""
+        self._coldpreview_disk.invalidate(hothash)
+        with self._coldpreviews_lock:
+            for key in [key for key in self._coldpreviews if key[0] == hothash]:
+                self._coldpreviews_size -= len(self._coldpreviews.pop(key))
     
     def get_coldpreview(self, hothash: str, width: Optional[int] = None, height: Optional[int] = None) -> bytes:
         """
@@ -644,6 +1098,17 @@ class APIClient:
         Returns:
             JPEG image bytes (medium-size preview, 800-1200px default)
         """
+        # Cached in memory until the coldpreview is replaced or the photo
+        # deleted through this client (viewer navigation revisits the same
+        # photos). On disk, entries are revalidated with If-None-Match, so
+        # an unchanged preview costs a headers-only 304 response.
+        key = (hothash, width, height)
+        with self._coldpreviews_lock:
+            data = self._coldpreviews.get(key)
+            if data is not None:
+                self._coldpreviews.move_to_end(key)
+                return data
+        
         url = f"{self.base_url}/api/v1/photos/{hothash}/coldpreview"
         params = {}
         if width:
@@ -651,65 +1116,267 @@ class APIClient:
         if height:
             params["height"] = height
         
-        response = requests.get(url, headers=self._headers(), params=params)
-        response.raise_for_status()
-        return response.content
+        headers = self._headers()
+        cached = self._coldpreview_disk.get(hothash, width, height)
+        if cached is not None:
+            headers = {**headers, "If-None-Match": cached[0]}
+        
+        response = self.session.get(url, headers=headers, params=params)
+        if response.status_code == 304 and cached is not None:
+            data = cached[1]
+        else:
+            response.raise_for_status()
+            data = response.content
+            etag = response.headers.get("ETag")
+            if etag:
+                self._coldpreview_disk.put(hothash, width, height, etag, data)
+        
+        with self._coldpreviews_lock:
+            old = self._coldpreviews.pop(key, None)
+            if old is not None:
+                self._coldpreviews_size -= len(old)
+            self._coldpreviews[key] = data
+            self._coldpreviews_size += len(data)
+            while self._coldpreviews_size > COLDPREVIEW_CACHE_BYTES and len(self._coldpreviews) > 1:
+                self._coldpreviews_size -= len(self._coldpreviews.popitem(last=False)[1])
+        return data
+    
+    @staticmethod
+    def _import_payload(
+        filename: str,
+        hotpreview_base64: Optional[str],
+        file_size: Optional[int],
+        session_id: Optional[int],
+        taken_at: Optional[str],
+        gps_latitude: Optional[float],
+        gps_longitude: Optional[float],
+        exif_dict: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build new-photo payload according to API v2.1 specification"""
+        payload = {"filename": filename}
+        if hotpreview_base64:
+            payload["hotpreview"] = hotpreview_base64
+        
+        # Add optional fields
+        if file_size:
+            payload["file_size"] = file_size
+        if taken_at:
+            payload["taken_at"] = taken_at
+        if gps_latitude is not None and gps_longitude is not None:
+            payload["gps_latitude"] = gps_latitude
+            payload["gps_longitude"] = gps_longitude
+        if exif_dict:
+            payload["exif_dict"] = exif_dict
+        if session_id:
+            payload["import_session_id"] = session_id
+        return payload
     
     def import_photo(
         self,
         filename: str,
-        hotpreview_base64: str,
+        hotpreview_base64: Optional[str] = None,
         file_size: Optional[int] = None,
         session_id: Optional[int] = None,
         taken_at: Optional[str] = None,
         gps_latitude: Optional[float] = None,
         gps_longitude: Optional[float] = None,
         exif_dict: Optional[Dict[str, Any]] = None,
+        hotpreview_bytes: Optional[bytes] = None,
     ) -> Dict[str, Any]:
         """
         Import a new photo to the backend (legacy method).
         
         Endpoint: POST /api/v1/photos/new-photo
         
+        Sends JSON with the base64 hotpreview by default. When multipart_import
+        is enabled and hotpreview_bytes is given, the JPEG is sent as a raw
+        multipart file part ("hotpreview") with the remaining fields as a JSON
+        part ("metadata") - no base64 inflation or encode/decode. If the
+        backend rejects the multipart body (415, or a 422 about the body or
+        its parts), multipart_import is switched off; on any 422 the photo
+        is resent as JSON.
+        
         Args:
             filename: Original filename (required)
-            hotpreview_base64: Base64-encoded hotpreview JPEG 300x300px (required)
+            hotpreview_base64: Base64-encoded hotpreview JPEG
+                (required unless hotpreview_bytes is used)
             file_size: File size in bytes
             session_id: Import session ID
             taken_at: ISO 8601 timestamp
             gps_latitude: GPS latitude in decimal degrees
             gps_longitude: GPS longitude in decimal degrees
             exif_dict: Complete EXIF metadata dictionary (should include ImageWidth/ImageHeight)
+            hotpreview_bytes: Raw hotpreview JPEG bytes (used for multipart import)
             
         Returns:
             API response with photo_hothash, image_file_id, etc.
         """
         url = f"{self.base_url}/api/v1/photos/new-photo"
+        use_multipart = self.multipart_import and hotpreview_bytes is not None
+        if not use_multipart and not hotpreview_base64:
+            raise ValueError("import_photo requires hotpreview_base64 (or hotpreview_bytes with multipart_import)")
+        
+        payload = self._import_payload(
+            filename, None if use_multipart else hotpreview_base64, file_size,
+            session_id, taken_at, gps_latitude, gps_longitude, exif_dict
+        )
+        
+        log.debug("Sending import_photo with session_id=%s, payload has import_session_id=%s",
+                  session_id, payload.get('import_session_id'))
+        
+        if use_multipart:
+            files = {
+                'hotpreview': ('hotpreview.jpg', hotpreview_bytes, 'image/jpeg'),
+                'metadata': (None, _dumps(payload), 'application/json'),
+            }
+            # Auth header only - requests sets the multipart Content-Type
+            response = self.session.post(url, files=files, headers=self._auth_headers)
+            if response.status_code in (415, 422):
+                if response.status_code == 415 or self._multipart_rejected(response):
+                    # Backend only accepts the JSON body - use it from now on
+                    log.warning("Backend rejected multipart import (%s) - falling back to JSON",
+                                response.status_code)
+                    self.multipart_import = False
+                # Other validation errors: retry this photo only, as JSON
+                use_multipart = False
+                payload["hotpreview"] = (hotpreview_base64
+                                         or base64.b64encode(hotpreview_bytes).decode("ascii"))
+        if not use_multipart:
+            response = self.session.post(url, data=_dumps(payload), headers=self._headers())
+        response.raise_for_status()
+        return _loads(response.content)
+    
+    @staticmethod
+    def _multipart_rejected(response) -> bool:
+        """
+        Whether a 422 for a multipart import means the backend does not
+        take multipart bodies (rather than rejecting this photo's data).
         
-        # Build payload according to API v2.1 specification
-        payload = {
-            "filename": filename,
-            "hotpreview": hotpreview_base64,  # Required
-        }
+        FastAPI reports a JSON-only endpoint as an error at loc ["body"],
+        or as the multipart parts/fields it expected to be missing.
+        """
+        try:
+            detail = _loads(response.content).get("detail")
+        except Exception:
+            return False
+        if not isinstance(detail, list):
+            return False
+        for error in detail:
+            if not isinstance(error, dict):
+                continue
+            loc = [str(part) for part in error.get("loc") or ()]
+            if loc == ["body"]:
+                return True
+            if error.get("type") == "missing" and loc and loc[-1] in MULTIPART_IMPORT_FIELDS:
+                return True
+        return False
+    
+    def import_photos_batch(self, photos: List[Dict[str, Any]],
+                            batch_size: int = 64) -> List[Dict[str, Any]]:
+        """
+        Import several photos with one request per batch.
+        
+        Endpoint: POST /api/v1/photos/new-photo/bulk (JSON array of new-photo
+        payloads, response is an array of per-photo results). With
+        gzip_requests, large bodies are gzip-compressed. If the backend does
+        not provide the endpoint, falls back to import_photo() calls (in
+        parallel) and remembers that; a batch the endpoint rejects (415, 422)
+        is imported the same way.
         
-        # Add optional fields
-        if file_size:
-            payload["file_size"] = file_size
-        if taken_at:
-            payload["taken_at"] = taken_at
-        if gps_latitude is not None and gps_longitude is not None:
-            payload["gps_latitude"] = gps_latitude
-            payload["gps_longitude"] = gps_longitude
-        if exif_dict:
-            payload["exif_dict"] = exif_dict
-        if session_id:
-            payload["import_session_id"] = session_id
+        Args:
+            photos: Keyword arguments for import_photo(), one dict per photo
+                (each needs hotpreview_base64 or hotpreview_bytes)
+            batch_size: Photos per request
+            
+        Returns:
+            One result per photo, in input order - the API response, or
+            {"error": message} if that photo (or its whole batch) failed
+            
+        Raises:
+            ValueError: If a photo has neither hotpreview_base64 nor hotpreview_bytes
+        """
+        for photo in photos:
+            if not photo.get("hotpreview_base64") and photo.get("hotpreview_bytes") is None:
+                raise ValueError(f"import_photos_batch: no hotpreview for {photo.get('filename')}")
+        
+        url = f"{self.base_url}/api/v1/photos/new-photo/bulk"
+        results = []
+        for start in range(0, len(photos), batch_size):
+            batch = photos[start:start + batch_size]
+            if self._bulk_import_supported:
+                try:
+                    batch_results = self._post_import_batch(url, batch)
+                except Exception as e:
+                    # Keep results of earlier batches - fail this batch only
+                    log.warning("Bulk import of %d photos failed: %s", len(batch), e)
+                    results.extend({"error": str(e)} for _ in batch)
+                    continue
+                if batch_results is not None:
+                    results.extend(batch_results)
+                    continue
+            
+            # One request per photo, overlapped over the connection pool
+            with ThreadPoolExecutor(max_workers=min(8, len(batch))) as executor:
+                results.extend(executor.map(self._import_photo_result, batch))
+        return results
+    
+    def _post_import_batch(self, url: str, batch: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Send one batch to the bulk import endpoint.
         
-        print(f"DEBUG APIClient: Sending import_photo with session_id={session_id}, payload has import_session_id={payload.get('import_session_id')}")  # DEBUG
+        A gzip body the backend rejects is resent uncompressed, and
+        gzip_requests is switched off if that succeeds.
         
-        response = requests.post(url, json=payload, headers=self._headers())
+        Returns:
+            Per-photo results, or None if the batch must be imported photo
+            by photo (clears _bulk_import_supported if the endpoint is missing)
+        """
+        payloads = []
+        for photo in batch:
+            hotpreview_base64 = photo.get("hotpreview_base64")
+            if not hotpreview_base64:
+                hotpreview_base64 = base64.b64encode(photo["hotpreview_bytes"]).decode("ascii")
+            payloads.append(self._import_payload(
+                photo["filename"], hotpreview_base64,
+                photo.get("file_size"), photo.get("session_id"),
+                photo.get("taken_at"), photo.get("gps_latitude"),
+                photo.get("gps_longitude"), photo.get("exif_dict")
+            ))
+        body = _dumps(payloads)
+        response = None
+        if self.gzip_requests and len(body) > GZIP_MIN_SIZE:
+            response = self.session.post(url, data=gzip.compress(body, compresslevel=1),
+                                         headers={**self._headers(), "Content-Encoding": "gzip"})
+        if response is None or response.status_code in (400, 415, 422):
+            gzip_status = response.status_code if response is not None else None
+            response = self.session.post(url, data=body, headers=self._headers())
+            if gzip_status is not None and response.status_code < 400:
+                # Only the compressed body was rejected
+                log.warning("Backend rejected gzip request body (%s) - sending uncompressed",
+                            gzip_status)
+                self.gzip_requests = False
+        if response.status_code in (404, 405):
+            log.debug("Bulk import not supported by backend - importing one by one")
+            self._bulk_import_supported = False
+            return None
+        if response.status_code in BULK_FALLBACK_STATUSES:
+            log.warning("Bulk import of %d photos rejected (%s) - importing one by one",
+                        len(batch), response.status_code)
+            return None
         response.raise_for_status()
-        return response.json()
+        batch_results = _loads(response.content)
+        if not isinstance(batch_results, list) or len(batch_results) != len(batch):
+            raise ValueError(f"Bulk import returned an unexpected response for {len(batch)} photos")
+        return batch_results
+    
+    def _import_photo_result(self, photo: Dict[str, Any]) -> Dict[str, Any]:
+        """import_photo(**photo), with a failure returned as {"error": message}"""
+        if not photo.get("hotpreview_base64") and not self.multipart_import:
+            photo = {**photo, "hotpreview_base64": base64.b64encode(photo["hotpreview_bytes"]).decode("ascii")}
+        try:
+            return self.import_photo(**photo)
+        except Exception as e:
+            return {"error": str(e)}
     
     def upload_coldpreview(self, hothash: str, coldpreview_bytes: bytes) -> Dict[str, Any]:
         """
@@ -729,12 +1396,11 @@ class APIClient:
         # Create multipart form data
         files = {'file': ('coldpreview.jpg', coldpreview_bytes, 'image/jpeg')}
         
-                # Use auth headers without Content-Type (requests will set it for multipart)
-        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
-        
-        response = requests.put(url, files=files, headers=headers)
+        # Use auth headers without Content-Type (requests will set it for multipart)
+        response = self.session.put(url, files=files, headers=self._auth_headers)
         response.raise_for_status()
-        return response.json()
+        self.invalidate_coldpreview(hothash)
+        return _loads(response.content)
     
     # ========================================
     # PHOTO SEARCH ENDPOINTS
@@ -760,9 +1426,9 @@ class APIClient:
             }
         """
         url = f"{self.base_url}/api/v1/photo-searches/ad-hoc"
-        response = requests.post(url, json=criteria, headers=self._headers())
+        response = self.session.post(url, data=_dumps(criteria), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def list_saved_searches(self, offset: int = 0, limit: int = 100, 
                            favorites_only: bool = False) -> Dict[str, Any]:
@@ -781,9 +1447,9 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/photo-searches/"
         params = {"offset": offset, "limit": limit, "favorites_only": favorites_only}
-        response = requests.get(url, headers=self._headers(), params=params)
+        response = self.session.get(url, headers=self._headers(), params=params)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def create_saved_search(self, name: str, search_criteria: Dict[str, Any],
                            description: Optional[str] = None,
@@ -811,9 +1477,9 @@ class APIClient:
         if description:
             data["description"] = description
         
-        response = requests.post(url, json=data, headers=self._headers())
+        response = self.session.post(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def get_saved_search(self, search_id: int) -> Dict[str, Any]:
         """
@@ -825,9 +1491,9 @@ class APIClient:
             SavedPhotoSearchResponse
         """
         url = f"{self.base_url}/api/v1/photo-searches/{search_id}"
-        response = requests.get(url, headers=self._headers())
+        response = self.session.get(url, headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def update_saved_search(self, search_id: int, name: Optional[str] = None,
                            search_criteria: Optional[Dict[str, Any]] = None,
@@ -859,9 +1525,9 @@ class APIClient:
         if is_favorite is not None:
             data["is_favorite"] = is_favorite
         
-        response = requests.put(url, json=data, headers=self._headers())
+        response = self.session.put(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def delete_saved_search(self, search_id: int):
         """
@@ -873,7 +1539,7 @@ class APIClient:
             204 No Content on success
         """
         url = f"{self.base_url}/api/v1/photo-searches/{search_id}"
-        response = requests.delete(url, headers=self._headers())
+        response = self.session.delete(url, headers=self._headers())
         response.raise_for_status()
     
     def execute_saved_search(self, search_id: int, 
@@ -908,9 +1574,9 @@ class APIClient:
         if override_limit is not None:
             params["override_limit"] = override_limit
         
-        response = requests.post(url, headers=self._headers(), params=params)
+        response = self.session.post(url, headers=self._headers(), params=params)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     # ========================================
     # COLLECTIONS ENDPOINTS
@@ -943,9 +1609,9 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/collections"
         params = {"limit": limit, "offset": offset}
-        response = requests.get(url, params=params, headers=self._headers())
+        response = self.session.get(url, params=params, headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def create_collection(self, name: str, description: str = "", 
                          hothashes: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -970,9 +1636,9 @@ class APIClient:
         if hothashes:
             data["hothashes"] = hothashes
         
-        response = requests.post(url, json=data, headers=self._headers())
+        response = self.session.post(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def get_collection(self, collection_id: int) -> Dict[str, Any]:
         """
@@ -994,9 +1660,9 @@ class APIClient:
             }
         """
         url = f"{self.base_url}/api/v1/collections/{collection_id}"
-        response = requests.get(url, headers=self._headers())
+        response = self.session.get(url, headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def update_collection(self, collection_id: int, 
                          name: Optional[str] = None,
@@ -1016,9 +1682,9 @@ class APIClient:
         if description is not None:
             data["description"] = description
         
-        response = requests.put(url, json=data, headers=self._headers())
+        response = self.session.put(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def delete_collection(self, collection_id: int):
         """
@@ -1030,7 +1696,7 @@ class APIClient:
             204 No Content on success
         """
         url = f"{self.base_url}/api/v1/collections/{collection_id}"
-        response = requests.delete(url, headers=self._headers())
+        response = self.session.delete(url, headers=self._headers())
         response.raise_for_status()
     
     def add_photos_to_collection(self, collection_id: int, 
@@ -1049,9 +1715,9 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/collections/{collection_id}/photos"
         data = {"hothashes": hothashes}
-        response = requests.post(url, json=data, headers=self._headers())
+        response = self.session.post(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     def remove_photos_from_collection(self, collection_id: int,
                                      hothashes: List[str]) -> Dict[str, Any]:
@@ -1069,9 +1735,9 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/collections/{collection_id}/photos"
         data = {"hothashes": hothashes}
-        response = requests.delete(url, json=data, headers=self._headers())
+        response = self.session.delete(url, data=_dumps(data), headers=self._headers())
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
     
     # ========================================
     # STATISTICS ENDPOINTS
@@ -1109,6 +1775,6 @@ class APIClient:
         """
         url = f"{self.base_url}/api/v1/database-stats"
         # No auth headers needed - public endpoint
-        response = requests.get(url)
+        response = self.session.get(url)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
@@ -0,0 +1,139 @@
+"""
+Optional HTTP/2 transport for APIClient
+
+Requires httpx with HTTP/2 support (pip install "httpx[http2]"); importing
+this module raises ImportError otherwise.
+"""
+from typing import Any, Optional, Tuple
+
+import httpx
+import requests
+
+# Fail at import time (not on the first request) if h2 is missing
+import h2  # noqa: F401
+
+from .circuit_breaker import CircuitBreaker
+
+
+class HTTP2Response:
+    """
+    httpx.Response with requests-style raise_for_status().
+
+    Raises requests.exceptions.HTTPError (message and .response as in
+    requests) so callers handle both transports alike. Everything else is
+    delegated to the httpx response.
+    """
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    def raise_for_status(self):
+        """Raise requests.exceptions.HTTPError for 4xx/5xx responses"""
+        status = self._response.status_code
+        if 400 <= status < 600:
+            kind = "Client" if status < 500 else "Server"
+            raise requests.exceptions.HTTPError(
+                f"{status} {kind} Error: {self._response.reason_phrase} for url: {self._response.url}",
+                response=self
+            )
+
+
+def _requests_error(error: httpx.TransportError) -> requests.exceptions.RequestException:
+    """requests exception matching an httpx transport error"""
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.exceptions.ConnectTimeout(str(error))
+    if isinstance(error, httpx.TimeoutException):
+        return requests.exceptions.ReadTimeout(str(error))
+    if isinstance(error, (httpx.ConnectError, httpx.NetworkError, httpx.RemoteProtocolError)):
+        return requests.exceptions.ConnectionError(str(error))
+    return requests.exceptions.RequestException(str(error))
+
+
+class HTTP2Session:
+    """
+    Minimal requests.Session replacement backed by httpx (HTTP/2).
+
+    Concurrent requests are multiplexed over one connection per host
+    instead of one connection per in-flight request. Covers the subset of
+    the requests API that APIClient uses: get/head/post/put/patch/delete
+    with params, headers, data (bytes) and files. Responses are
+    HTTP2Response wrappers of httpx.Response (status_code, headers,
+    content, raise_for_status()). Errors are raised as the requests
+    exceptions callers expect: HTTPError from raise_for_status(),
+    ConnectionError/Timeout for transport failures.
+    """
+
+    def __init__(self, pool_size: int, timeout: Optional[Tuple[float, float]] = None,
+                 breaker: Optional[CircuitBreaker] = None):
+        """
+        Args:
+            pool_size: Maximum number of connections
+            timeout: Default (connect, read) timeout in seconds, None to wait
+                forever
+            breaker: Circuit breaker checked and updated by every request
+        """
+        self._breaker = breaker
+        if timeout is not None:
+            connect_timeout, read_timeout = timeout
+            timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size
+            ),
+            transport=httpx.HTTPTransport(http2=True, retries=3),
+            timeout=timeout
+        )
+
+    def request(self, method: str, url: str, data: Optional[Any] = None,
+                stream: bool = False, **kwargs) -> HTTP2Response:
+        """Send a request (stream is ignored - bodies are read eagerly)"""
+        if isinstance(data, (bytes, bytearray)):
+            kwargs["content"] = data  # httpx takes raw bodies as content=
+        elif data is not None:
+            kwargs["data"] = data
+        if self._breaker is not None:
+            self._breaker.before_request()
+        try:
+            response = self._client.request(method, url, **kwargs)
+        except Exception as e:
+            if self._breaker is not None:
+                self._breaker.record_failure()
+            if isinstance(e, httpx.TransportError):
+                raise _requests_error(e) from e
+            raise
+        if self._breaker is not None:
+            self._breaker.record_response(response.status_code)
+        return HTTP2Response(response)
+
+    def get(self, url: str, **kwargs) -> HTTP2Response:
+        """Send a GET request"""
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> HTTP2Response:
+        """Send a HEAD request"""
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, data: Optional[Any] = None, **kwargs) -> HTTP2Response:
+        """Send a POST request"""
+        return self.request("POST", url, data=data, **kwargs)
+
+    def put(self, url: str, data: Optional[Any] = None, **kwargs) -> HTTP2Response:
+        """Send a PUT request"""
+        return self.request("PUT", url, data=data, **kwargs)
+
+    def patch(self, url: str, data: Optional[Any] = None, **kwargs) -> HTTP2Response:
+        """Send a PATCH request"""
+        return self.request("PATCH", url, data=data, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> HTTP2Response:
+        """Send a DELETE request"""
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self):
+        """Close all pooled connections"""
+        self._client.close()
@@ -0,0 +1,163 @@
+"""
+On-disk coldpreview cache for APIClient
+
+Stores coldpreview JPEGs together with the ETag the backend sent, so a
+later fetch (also after a restart) can revalidate with If-None-Match and
+get a headers-only 304 instead of the image again.
+"""
+import logging
+import os
+import threading
+from typing import Optional, Tuple
+
+
+log = logging.getLogger(__name__)
+
+# Total size the cache is pruned back to (least recently used files first)
+DISK_CACHE_BYTES = 512 * 1024 * 1024
+
+# Check the cache size every this many writes
+PRUNE_INTERVAL = 64
+
+
+class PreviewDiskCache:
+    """
+    Coldpreview bytes + ETag per (hothash, width, height), one file each,
+    grouped in one subdirectory per hothash.
+
+    Entries are never served without revalidation - APIClient always asks
+    the backend, which keeps access control and freshness on the server.
+    Reads bump the file's mtime, so pruning removes least recently used
+    entries. Safe to use from several threads (writes are atomic renames).
+    """
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = DISK_CACHE_BYTES):
+        """
+        Args:
+            cache_dir: Directory for cached previews (default: ~/.imalink/coldpreviews/)
+            max_bytes: Size the cache is pruned back to
+        """
+        if cache_dir is None:
+            cache_dir = os.path.expanduser("~/.imalink/coldpreviews")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+    def _photo_dir(self, hothash: str) -> str:
+        """Directory holding all cached sizes of one photo"""
+        return os.path.join(self.cache_dir, hothash)
+
+    def _path(self, hothash: str, width: Optional[int], height: Optional[int]) -> str:
+        """File path for a cache entry"""
+        return os.path.join(self._photo_dir(hothash), f"{width or 0}x{height or 0}.jpg")
+
+    def get(self, hothash: str, width: Optional[int] = None,
+            height: Optional[int] = None) -> Optional[Tuple[str, bytes]]:
+        """
+        Get a cached coldpreview.
+
+        Returns:
+            (etag, JPEG bytes), or None if not cached
+        """
+        path = self._path(hothash, width, height)
+        try:
+            with open(path + ".etag", "r", encoding="utf-8") as f:
+                etag = f.read()
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return etag, data
+
+    def put(self, hothash: str, width: Optional[int], height: Optional[int],
+            etag: str, data: bytes):
+        """Store a coldpreview with the ETag it was served with"""
+        path = self._path(hothash, width, height)
+        try:
+            os.makedirs(self._photo_dir(hothash), exist_ok=True)
+            # Image first: a readable .etag always has a matching image
+            for target, content in ((path, data), (path + ".etag", etag.encode("utf-8"))):
+                tmp = f"{target}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(content)
+                os.replace(tmp, target)
+        except OSError as e:
+            log.warning("Failed to cache coldpreview %s: %s", hothash, e)
+            return
+
+        with self._writes_lock:
+            self._writes += 1
+            prune = self._writes % PRUNE_INTERVAL == 0
+        if prune:
+            self.prune()
+
+    def invalidate(self, hothash: str):
+        """
+        Remove all cached sizes of a photo's coldpreview.
+
+        Only lists the photo's own directory, which usually does not exist
+        (called for every newly imported photo).
+        """
+        self._remove_photo_dir(self._photo_dir(hothash))
+
+    def _remove_photo_dir(self, photo_dir: str):
+        """Delete one photo's directory with all its entries (if it exists)"""
+        try:
+            entries = list(os.scandir(photo_dir))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+        try:
+            os.rmdir(photo_dir)
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove all cached coldpreviews (e.g. when the user logs out)"""
+        try:
+            photo_dirs = [entry.path for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+        except OSError:
+            return
+        for photo_dir in photo_dirs:
+            self._remove_photo_dir(photo_dir)
+
+    def prune(self):
+        """Delete least recently used entries until the cache fits max_bytes"""
+        images = []
+        total = 0
+        try:
+            photo_dirs = [entry.path for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+        except OSError:
+            return
+        for photo_dir in photo_dirs:
+            try:
+                for entry in os.scandir(photo_dir):
+                    if entry.name.endswith(".jpg"):
+                        st = entry.stat()
+                        images.append((st.st_mtime, st.st_size, entry.path))
+                        total += st.st_size
+            except OSError:
+                continue  # Removed concurrently
+        if total <= self.max_bytes:
+            return
+
+        images.sort()
+        for _, size, path in images:
+            for target in (path + ".etag", path):
+                try:
+                    os.remove(target)
+                except OSError:
+                    pass
+            try:
+                os.rmdir(os.path.dirname(path))  # Only succeeds once empty
+            except OSError:
+                pass
+            total -= size
+            if total <= self.max_bytes:
+                break
@@ -0,0 +1,124 @@
+"""
+Fork-server launcher (Linux/macOS, opt-in).
+
+`python main.py --serve` starts a long-running process that has PySide6
+and the UI modules already imported and waits on a FIFO. `python main.py
+--launch` asks that server to fork() a child which runs the app with a
+warm interpreter, so imports and Qt library loading are skipped. If no
+server is running, --launch falls back to a normal start.
+"""
+import errno
+import os
+import signal
+import stat
+import sys
+from pathlib import Path
+from typing import Callable
+
+
+LAUNCH_COMMAND = b"launch\n"
+
+
+def is_supported() -> bool:
+    """Fork-server needs fork() and FIFOs (not available on Windows)"""
+    return hasattr(os, "fork") and hasattr(os, "mkfifo")
+
+
+def fifo_path() -> Path:
+    """Per-user FIFO the server listens on"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return Path(runtime_dir) / f"imalink-{os.getuid()}.fifo"
+
+
+def _check_fifo(path: Path):
+    """
+    Make sure path is our own private FIFO.
+    
+    With the /tmp fallback another local user could have created the file
+    first, and would then see (or feed) our launch requests.
+    
+    Raises:
+        RuntimeError: If path is not a FIFO owned by us with mode 0600
+    """
+    info = os.lstat(path)
+    if not stat.S_ISFIFO(info.st_mode):
+        raise RuntimeError(f"{path} exists and is not a FIFO")
+    if info.st_uid != os.getuid():
+        raise RuntimeError(f"{path} is owned by another user")
+    if stat.S_IMODE(info.st_mode) != 0o600:
+        raise RuntimeError(f"{path} must have mode 0600, has {stat.S_IMODE(info.st_mode):04o}")
+
+
+def request_launch() -> bool:
+    """
+    Ask a running server to start a new app instance.
+    
+    Returns:
+        True if a server accepted the request, False if none is running
+    """
+    if not is_supported():
+        return False
+    try:
+        # Non-blocking open fails with ENXIO when nobody is reading
+        fd = os.open(fifo_path(), os.O_WRONLY | os.O_NONBLOCK)
+    except OSError as e:
+        if e.errno in (errno.ENXIO, errno.ENOENT):
+            return False
+        raise
+    try:
+        os.write(fd, LAUNCH_COMMAND)
+    finally:
+        os.close(fd)
+    return True
+
+
+def serve(run_app: Callable[[], int]):
+    """
+    Preload the UI and fork a child running run_app() per launch request.
+    
+    Args:
+        run_app: Callable creating QApplication/MainWindow and running the
+                 event loop; returns the exit code. Runs only in children.
+    """
+    if not is_supported():
+        raise RuntimeError("Fork-server mode is not supported on this platform")
+    
+    # Warm import cache - children inherit the loaded modules and Qt libraries.
+    # No QApplication may exist in the server process itself.
+    import PySide6.QtWidgets  # noqa: F401
+    import src.ui.main_window  # noqa: F401
+    
+    path = fifo_path()
+    try:
+        os.mkfifo(path, 0o600)
+    except FileExistsError:
+        pass  # Left by an earlier server - checked below
+    _check_fifo(path)
+    
+    # Children are never waited on - let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    print(f"[Launcher] Serving launch requests on {path}", file=sys.stderr)
+    
+    while True:
+        # Blocks until a client opens the FIFO for writing
+        with open(path, "rb") as fifo:
+            for line in fifo:
+                if line != LAUNCH_COMMAND:
+                    continue
+                if os.fork() == 0:
+                    # Drop the inherited read end - a running instance must
+                    # not keep the FIFO "served" after the server is gone
+                    fifo.close()
+                    os.setsid()
+                    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                    exit_code = 1
+                    try:
+                        exit_code = run_app()
+                    finally:
+                        # os._exit skips stdio flushing - flush like main()
+                        # does, but never fall back into the server loop
+                        try:
+                            sys.stdout.flush()
+                            sys.stderr.flush()
+                        finally:
+                            os._exit(exit_code)
@@ -21,6 +21,7 @@ class ImageImportData:
     hotpreview_base64: str
     hothash: str
     coldpreview_bytes: Optional[bytes] = None
+    file_mtime_ns: Optional[int] = None  # For HothashCache validity
     
     # Basic metadata (98%+ reliable)
     taken_at: Optional[str] = None
@@ -4,12 +4,35 @@ Photo domain model - Separates Qt UI from API JSON structure
 This model provides a clean interface between the API layer and the UI layer.
 Qt widgets work with PhotoModel objects, never with raw API dictionaries.
 """
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, List
 from datetime import datetime
 
 
-@dataclass
+# Gallery views hold thousands of models - drop the per-instance __dict__
+# where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(value: str) -> Optional[datetime]:
+    """
+    Parse ISO 8601 timestamp from API (None if invalid).
+    
+    Cached: photo lists repeat the same import timestamps for every photo
+    of an import session. datetime objects are immutable, so sharing is safe.
+    """
+    try:
+        # Handle ISO 8601 format with Z timezone
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        # If parsing fails, leave as None
+        return None
+
+
+@dataclass(**_SLOTS)
 class ImageFileModel:
     """Represents an image file associated with a photo"""
     filename: str
@@ -30,7 +53,7 @@ class ImageFileModel:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PhotoModel:
     """
     Domain model for Photo.
@@ -138,39 +161,21 @@ class PhotoModel:
         Returns:
             PhotoModel with parsed and validated data
         """
-        # Parse taken_at timestamp
-        taken_at = None
-        if data.get('taken_at'):
-            try:
-                # Handle ISO 8601 format with Z timezone
-                taken_at_str = data['taken_at'].replace('Z', '+00:00')
-                taken_at = datetime.fromisoformat(taken_at_str)
-            except (ValueError, AttributeError):
-                # If parsing fails, leave as None
-                pass
-        
-        # Parse first_imported timestamp
-        first_imported = None
-        if data.get('first_imported'):
-            try:
-                first_imported_str = data['first_imported'].replace('Z', '+00:00')
-                first_imported = datetime.fromisoformat(first_imported_str)
-            except (ValueError, AttributeError):
-                pass
+        get = data.get  # Called ~25 times per photo - bind once
         
-        # Parse last_imported timestamp
-        last_imported = None
-        if data.get('last_imported'):
-            try:
-                last_imported_str = data['last_imported'].replace('Z', '+00:00')
-                last_imported = datetime.fromisoformat(last_imported_str)
-            except (ValueError, AttributeError):
-                pass
+        # Parse timestamps
+        taken_at = get('taken_at')
+        taken_at = _parse_timestamp(taken_at) if isinstance(taken_at, str) else None
+        first_imported = get('first_imported')
+        first_imported = _parse_timestamp(first_imported) if isinstance(first_imported, str) else None
+        last_imported = get('last_imported')
+        last_imported = _parse_timestamp(last_imported) if isinstance(last_imported, str) else None
         
         # Parse image_files list
         image_files = []
-        if data.get('image_files') and isinstance(data['image_files'], list):
-            for img_data in data['image_files']:
+        image_files_data = get('image_files')
+        if image_files_data and isinstance(image_files_data, list):
+            for img_data in image_files_data:
                 try:
                     image_files.append(ImageFileModel.from_dict(img_data))
                 except Exception:
@@ -180,34 +185,34 @@ class PhotoModel:
         # Build PhotoModel with all available data
         return cls(
             # Required
-            id=data.get('id', 0),
-            hothash=data.get('hothash', ''),
+            id=get('id', 0),
+            hothash=get('hothash', ''),
             
             # Optional metadata
-            primary_filename=data.get('primary_filename'),
+            primary_filename=get('primary_filename'),
             image_files=image_files,
             taken_at=taken_at,
-            rating=data.get('rating'),
+            rating=get('rating'),
             
             # Import tracking
-            import_session_id=data.get('import_session_id'),
+            import_session_id=get('import_session_id'),
             first_imported=first_imported,
             last_imported=last_imported,
-            has_gps=data.get('has_gps', False),
-            has_raw_companion=data.get('has_raw_companion', False),
+            has_gps=get('has_gps', False),
+            has_raw_companion=get('has_raw_companion', False),
             
             # EXIF
-            camera_make=data.get('camera_make'),
-            camera_model=data.get('camera_model'),
-            lens_model=data.get('lens_model'),
-            focal_length=data.get('focal_length'),
-            aperture=data.get('aperture'),
-            shutter_speed=data.get('shutter_speed'),
-            iso=data.get('iso'),
+            camera_make=get('camera_make'),
+            camera_model=get('camera_model'),
+            lens_model=get('lens_model'),
+            focal_length=get('focal_length'),
+            aperture=get('aperture'),
+            shutter_speed=get('shutter_speed'),
+            iso=get('iso'),
             
             # GPS
-            latitude=data.get('gps_latitude'),
-            longitude=data.get('gps_longitude')
+            latitude=get('gps_latitude'),
+            longitude=get('gps_longitude')
         )
     
     def to_dict(self) -> dict:
@@ -0,0 +1,97 @@
+"""
+Startup prefetching - warms up files needed at startup.
+
+Must be imported before PySide6 and the rest of src (see main.py).
+- Bytecode: readahead hint for the cached .pyc files under src, in a
+  daemon thread so startup does not wait for it (Linux)
+- Qt libraries: opt-in via IMALINK_PREFETCH_SO=1 so the effect can be
+  measured in isolation (see IMALINK_PROFILE in main.py)
+"""
+import ctypes
+import importlib.util
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import List
+
+
+# Qt libraries needed by the widgets app (QtCore/QtGui/QtWidgets and
+# their platform dependencies) - other Qt modules are never loaded
+QT_LIBRARIES = ("Core", "Gui", "Widgets", "DBus", "XcbQpa", "WaylandClient")
+
+
+# Package root whose compiled bytecode is prefetched
+SRC_DIR = Path(__file__).resolve().parent
+
+
+def prefetch_bytecode():
+    """
+    Ask the kernel to read the app's cached .pyc files into the page cache,
+    so imports after a cold boot do not wait for disk seeks one by one.
+    
+    Only bytecode for the running interpreter is touched - files compiled
+    by other Python versions are never imported.
+    
+    Bytecode is generated at install time with:
+        python -m compileall -j 0 src
+    """
+    cache_tag = sys.implementation.cache_tag
+    if not hasattr(os, "posix_fadvise") or cache_tag is None:
+        return
+    for dirpath, dirnames, filenames in os.walk(SRC_DIR):
+        if os.path.basename(dirpath) != "__pycache__":
+            continue
+        for filename in filenames:
+            if cache_tag not in filename:
+                continue
+            try:
+                fd = os.open(os.path.join(dirpath, filename), os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+
+def _find_qt_libraries() -> List[Path]:
+    """Locate PySide6's bundled Qt shared libraries without importing PySide6"""
+    spec = importlib.util.find_spec("PySide6")
+    if spec is None or not spec.submodule_search_locations:
+        return []
+    package_dir = Path(next(iter(spec.submodule_search_locations)))
+    
+    if sys.platform == "win32":
+        patterns = [f"Qt6{name}.dll" for name in QT_LIBRARIES]
+        search_dir = package_dir
+    elif sys.platform == "darwin":
+        return []  # Frameworks are resolved by the loader, nothing to gain
+    else:
+        patterns = [f"libQt6{name}.so.6" for name in QT_LIBRARIES]
+        search_dir = package_dir / "Qt" / "lib"
+    
+    return [search_dir / pattern for pattern in patterns if (search_dir / pattern).is_file()]
+
+
+def _load_library(path: Path):
+    """dlopen a library so pages and symbols are resolved ahead of import"""
+    try:
+        ctypes.CDLL(str(path), mode=getattr(ctypes, "RTLD_GLOBAL", 0))
+    except OSError:
+        pass  # Missing dependency - PySide6 import will report it properly
+
+
+def prefetch_qt_libraries():
+    """Load Qt shared libraries in parallel daemon threads"""
+    for path in _find_qt_libraries():
+        threading.Thread(target=_load_library, args=(path,), daemon=True).start()
+
+
+if sys.platform.startswith("linux"):
+    threading.Thread(target=prefetch_bytecode, daemon=True).start()
+
+if os.environ.get("IMALINK_PREFETCH_SO") == "1":
+    prefetch_qt_libraries()
@@ -1,7 +1,9 @@
 """Services for ImaLink Qt Frontend"""
 
 from .import_scanner import ImportScanner
+from .hothash_cache import HothashCache
 
 __all__ = [
     'ImportScanner',
+    'HothashCache',
 ]
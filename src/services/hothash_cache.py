@@ -0,0 +1,98 @@
+"""HothashCache - Remembers the hothash of already imported files"""
+import json
+import logging
+import os
+from typing import Dict, Iterable, Optional
+
+
+log = logging.getLogger(__name__)
+
+
+class HothashCache:
+    """
+    Persistent map of file path -> hothash for imported files.
+
+    An entry is only valid while the file's mtime and size are unchanged,
+    so re-importing a directory can find out which photos the backend
+    already has without decoding the files again.
+    """
+
+    def __init__(self, config_dir: str = None):
+        """
+        Initialize HothashCache
+
+        Args:
+            config_dir: Directory for storing hothashes.json (default: ~/.imalink/)
+        """
+        if config_dir is None:
+            config_dir = os.path.expanduser("~/.imalink")
+
+        self.cache_file = os.path.join(config_dir, "hothashes.json")
+        # path -> [mtime_ns, size, hothash]
+        self._entries: Dict[str, list] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """Load cache from JSON file (empty cache if missing or unreadable)"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f).get('files', {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("Ignoring unreadable hothash cache %s: %s", self.cache_file, e)
+
+    def save(self):
+        """Write cache to disk if it changed (atomically)"""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_file = self.cache_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': '1.0', 'files': self._entries}, f)
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+        except OSError as e:
+            log.warning("Failed to save hothash cache: %s", e)
+
+    def lookup(self, file_paths: Iterable[str]) -> Dict[str, str]:
+        """
+        Get cached hothashes for files that are unchanged since caching.
+
+        Only files with a cache entry are stat'ed.
+
+        Args:
+            file_paths: Absolute file paths
+
+        Returns:
+            Dict of file path -> hothash
+        """
+        known = {}
+        for file_path in file_paths:
+            entry = self._entries.get(file_path)
+            if entry is None:
+                continue
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            if entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                known[file_path] = entry[2]
+        return known
+
+    def set(self, file_path: str, mtime_ns: Optional[int], size: int, hothash: str):
+        """
+        Remember the hothash of a file.
+
+        Args:
+            file_path: Absolute file path
+            mtime_ns: File modification time (ns) when the hothash was computed
+            size: File size in bytes
+            hothash: Hothash of the file's hotpreview
+        """
+        if mtime_ns is None or not hothash:
+            return
+        self._entries[file_path] = [mtime_ns, size, hothash]
+        self._dirty = True
@@ -1,12 +1,12 @@
 """Import scanner - processes images for import without UI dependencies"""
 
-from pathlib import Path
+import os
 from typing import List, Optional, Callable
 
 from ..models.import_data import ImageImportData
 from ..utils.image_utils import scan_directory_for_images, get_image_info
 from ..utils.exif_extractor import extract_basic_metadata, extract_camera_settings
-from ..utils.preview_generator import generate_hotpreview_and_hash, generate_coldpreview
+from ..utils.preview_generator import generate_previews
 
 
 class ImportScanner:
@@ -43,11 +43,14 @@ class ImportScanner:
         Returns:
             ImageImportData object with all metadata and previews
         """
-        path = Path(file_path)
+        # os.path instead of Path: no Path objects, and abspath() only calls
+        # getcwd() for relative paths (scanned paths are already absolute)
+        abs_path = os.path.abspath(file_path)
+        filename = os.path.basename(file_path)
         
         try:
-            # Get file info
-            file_size = path.stat().st_size
+            # Get file info (single stat for size and mtime)
+            stat = os.stat(file_path)
             
             # Extract basic metadata (98%+ reliable)
             basic_metadata = extract_basic_metadata(file_path)
@@ -55,17 +58,17 @@ class ImportScanner:
             # Extract camera settings (70-90% reliable, best-effort)
             camera_settings = extract_camera_settings(file_path)
             
-            # Generate hotpreview and hothash
-            hotpreview_bytes, hotpreview_b64, hothash = generate_hotpreview_and_hash(file_path)
-            
-            # Generate coldpreview (1000px)
-            coldpreview_bytes = generate_coldpreview(file_path, max_size=1000)
+            # Generate hotpreview, hothash and coldpreview (1000px) from one decode
+            hotpreview_bytes, hotpreview_b64, hothash, coldpreview_bytes = generate_previews(
+                file_path, cold_max_size=1000
+            )
             
             # Create import data object
             return ImageImportData(
-                file_path=str(path.absolute()),
-                filename=path.name,
-                file_size=file_size,
+                file_path=abs_path,
+                filename=filename,
+                file_size=stat.st_size,
+                file_mtime_ns=stat.st_mtime_ns,
                 hotpreview_bytes=hotpreview_bytes,
                 hotpreview_base64=hotpreview_b64,
                 hothash=hothash,
@@ -83,8 +86,8 @@ class ImportScanner:
         except Exception as e:
             # Return import data with error
             return ImageImportData(
-                file_path=str(path.absolute()),
-                filename=path.name,
+                file_path=abs_path,
+                filename=filename,
                 file_size=0,
                 hotpreview_bytes=b'',
                 hotpreview_base64='',
@@ -113,7 +116,7 @@ class ImportScanner:
         for i, file_path in enumerate(file_paths, 1):
             # Call progress callback if provided
             if progress_callback:
-                progress_callback(i, total, Path(file_path).name)
+                progress_callback(i, total, os.path.basename(file_path))
             
             # Process image
             result = self.process_image(file_path)
@@ -133,7 +133,7 @@ class ThumbnailCache:
             "photo_models_count": len(self._photo_models),
             "thumbnails_count": len(self._thumbnails),
             "photo_models_size_mb": sum(
-                len(str(p.__dict__)) for p in self._photo_models.values()
+                len(repr(p)) for p in self._photo_models.values()
             ) / 1024 / 1024,
             "thumbnails_size_mb": sum(
                 len(data) for data in self._thumbnails.values()
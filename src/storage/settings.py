@@ -56,3 +56,7 @@ class Settings:
     def clear_auth_token(self):
         """Clear auth token"""
         self._settings.remove("auth/token")
+    
+    def sync(self):
+        """Write pending changes to permanent storage"""
+        self._settings.sync()
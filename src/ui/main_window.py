@@ -13,8 +13,6 @@ from ..services.thumbnail_cache import ThumbnailCache
 from ..services.collection_manager import CollectionManager
 from ..services.search_manager import SearchManager
 from .navigation import NavigationPanel
-from .login_dialog import LoginDialog
-from .register_dialog import RegisterDialog
 from .views.home_view import HomeView
 from .views.collections_view import CollectionsView
 from .views.import_view import ImportView
@@ -321,6 +319,8 @@ class MainWindow(QMainWindow):
     
     def _show_login(self):
         """Show login dialog"""
+        from .login_dialog import LoginDialog
+        
         dialog = LoginDialog(self)
         dialog.api_client = self.api_client  # Give dialog access to API client
         
@@ -469,4 +469,7 @@ class MainWindow(QMainWindow):
         
         # Save window state
         self._save_state()
+        
+        # Release pooled API connections
+        self.api_client.close()
         event.accept()
@@ -0,0 +1,13 @@
+"""Shared QColor instances - allocated once instead of per paint/drag"""
+from PySide6.QtGui import QColor
+
+
+class Palette:
+    """Application colors (mirrors resources/styles/main.qss)"""
+    
+    BACKGROUND = QColor("#f5f5f5")
+    TEXT = QColor("#333333")
+    WHITE = QColor(255, 255, 255)
+    
+    # Semi-transparent blue used for drag pixmaps
+    DRAG_BACKGROUND = QColor(0, 120, 212, 200)
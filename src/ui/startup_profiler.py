@@ -0,0 +1,82 @@
+"""Startup profiler - records named startup spans when IMALINK_PROFILE=1"""
+import os
+import sys
+import time
+from typing import List, Tuple
+
+from PySide6.QtCore import QObject, QEvent
+
+
+ENABLED = os.environ.get("IMALINK_PROFILE") == "1"
+
+# Reference point for absolute timestamps (module is imported first thing in main)
+_start_ns = time.perf_counter_ns()
+
+# Recorded (name, duration_ns) spans
+_spans: List[Tuple[str, int]] = []
+
+
+def _reset_after_fork():
+    """Measure a forked child (fork-server launch) from the fork, not the server start"""
+    global _start_ns
+    _start_ns = time.perf_counter_ns()
+    _spans.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class Span:
+    """
+    Context manager timing a named startup step.
+    
+    No-op unless IMALINK_PROFILE=1.
+    
+    Example:
+        >>> with Span("stylesheet"):
+        ...     app.setStyleSheet(load_stylesheet())
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+        self._start = 0
+    
+    def __enter__(self) -> 'Span':
+        if ENABLED:
+            self._start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if ENABLED:
+            _spans.append((self.name, time.perf_counter_ns() - self._start))
+        return False
+
+
+class _FirstPaintFilter(QObject):
+    """Event filter recording time from startup to the first paint of a widget"""
+    
+    def __init__(self, widget):
+        super().__init__(widget)
+        self._widget = widget
+    
+    def eventFilter(self, obj, event) -> bool:
+        if obj is self._widget and event.type() == QEvent.Paint:
+            _spans.append(("time to first paint", time.perf_counter_ns() - _start_ns))
+            self._widget.removeEventFilter(self)
+        return False
+
+
+def watch_first_paint(widget):
+    """Record time-to-first-frame for widget (no-op unless profiling)"""
+    if ENABLED:
+        widget.installEventFilter(_FirstPaintFilter(widget))
+
+
+def dump():
+    """Print recorded spans to stderr, slowest first"""
+    if not ENABLED or not _spans:
+        return
+    print("[StartupProfiler] Startup spans:", file=sys.stderr)
+    for name, duration_ns in sorted(_spans, key=lambda span: span[1], reverse=True):
+        print(f"  {duration_ns / 1e6:10.2f} ms  {name}", file=sys.stderr)
@@ -0,0 +1,135 @@
+"""Global application stylesheet loading"""
+import os
+import re
+import struct
+from pathlib import Path
+from typing import Optional
+
+# Compiled Qt resources are optional - build with:
+#   python -m src.ui.stylesheet   (writes resources/styles/main.min.qss)
+#   pyside6-rcc resources/resources.qrc -o src/ui/resources_rc.py
+try:
+    from . import resources_rc  # noqa: F401 - registers :/styles/main.qss
+except ImportError:
+    resources_rc = None
+
+
+# Stylesheet inside the compiled Qt resource
+RESOURCE_PATH = ":/styles/main.qss"
+
+# Source stylesheet (resolved from project root, independent of CWD)
+SOURCE_PATH = Path(__file__).resolve().parents[2] / "resources" / "styles" / "main.qss"
+
+# Pre-minified stylesheet compiled into the Qt resource (see build_minified)
+MINIFIED_PATH = SOURCE_PATH.with_name("main.min.qss")
+
+# Bump when minify_stylesheet output changes - invalidates existing caches
+MINIFY_VERSION = 1
+
+# Cache file header: minifier version + source mtime (ns) + source size
+_CACHE_HEADER = struct.Struct("<BQQ")
+_CACHE_FILENAME = "main.qss.cache"
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_RE = re.compile(r"\s*([{};,>])\s*")
+
+
+def minify_stylesheet(stylesheet: str) -> str:
+    """
+    Strip comments and redundant whitespace from a Qt stylesheet.
+
+    Args:
+        stylesheet: Stylesheet source text
+
+    Returns:
+        Minified stylesheet with the same rules
+    """
+    stylesheet = _COMMENT_RE.sub("", stylesheet)
+    stylesheet = _WHITESPACE_RE.sub(" ", stylesheet)
+    return _PUNCTUATION_RE.sub(r"\1", stylesheet).strip()
+
+
+def _cache_path() -> Optional[Path]:
+    """Get path of the minified stylesheet cache (None if no cache dir)"""
+    from PySide6.QtCore import QStandardPaths
+
+    cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / _CACHE_FILENAME
+
+
+def _load_source_cached(source: Path) -> str:
+    """
+    Load minified source stylesheet, reusing the cache while the source
+    file (same mtime and size) and the minifier are unchanged.
+
+    An unreadable or damaged cache is ignored and rebuilt from the source.
+    """
+    cache_path = _cache_path()
+    header = None
+    try:
+        stat = source.stat()
+        header = _CACHE_HEADER.pack(MINIFY_VERSION, stat.st_mtime_ns, stat.st_size)
+        if cache_path is not None and cache_path.is_file():
+            data = cache_path.read_bytes()
+            if data[:_CACHE_HEADER.size] == header:
+                return data[_CACHE_HEADER.size:].decode("utf-8")
+    except (OSError, struct.error, UnicodeDecodeError):
+        pass  # Rebuilt from the source below
+
+    # Binary read + explicit decode skips text-mode newline translation
+    stylesheet = minify_stylesheet(source.read_bytes().decode("utf-8"))
+
+    if cache_path is not None and header is not None:
+        # Write atomically so a crash never leaves a half-written cache
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(header + stylesheet.encode("utf-8"))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Cache is an optimization only
+
+    return stylesheet
+
+
+def build_minified(source: Path = SOURCE_PATH, target: Path = MINIFIED_PATH):
+    """
+    Write the minified stylesheet compiled into the Qt resource.
+
+    Run before pyside6-rcc, so the app loads the resource without
+    minifying at startup.
+    """
+    stylesheet = minify_stylesheet(source.read_bytes().decode("utf-8"))
+    target.write_bytes(stylesheet.encode("utf-8"))
+
+
+def load_stylesheet() -> str:
+    """
+    Load the global stylesheet.
+
+    Prefers the compiled Qt resource (minified at build time) and falls
+    back to the source file (minified and cached across launches).
+
+    Returns:
+        Stylesheet text, or empty string if no stylesheet is available
+    """
+    from PySide6.QtCore import QFile, QIODevice
+
+    qss_file = QFile(RESOURCE_PATH)
+    if qss_file.exists() and qss_file.open(QIODevice.ReadOnly):
+        try:
+            return bytes(qss_file.readAll()).decode("utf-8")
+        finally:
+            qss_file.close()
+
+    if SOURCE_PATH.is_file():
+        return _load_source_cached(SOURCE_PATH)
+    return ""
+
+
+if __name__ == "__main__":
+    build_minified()
+    print(f"Wrote {MINIFIED_PATH}")
@@ -6,16 +6,30 @@ from PySide6.QtWidgets import (
     QListWidgetItem, QWidget, QDialog
 )
 from PySide6.QtCore import Qt
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
+import logging
+import multiprocessing
+import os
 from datetime import datetime
 from typing import List, Optional
 
 from .base_view import BaseView
 from ...services.import_scanner import ImportScanner
-from ...models.import_data import ImportSummary, ImportSession
+from ...services.hothash_cache import HothashCache
+from ...models.import_data import ImageImportData, ImportSummary, ImportSession
 from ..dialogs.new_import_dialog import NewImportSessionDialog
 
 
+log = logging.getLogger(__name__)
+
+# Parallel workers for preview generation + upload during import
+IMPORT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Processed photos sent per bulk import request
+IMPORT_BATCH_SIZE = 16
+
+
 class ImportView(BaseView):
     """
     Import view - photo import workflow
@@ -291,29 +305,28 @@ class ImportView(BaseView):
         Backend is the single source of truth - always fetch fresh data.
         Updates self.import_sessions state and rebuilds UI.
         """
-        print("DEBUG: _load_sessions_from_backend called")
+        log.debug("_load_sessions_from_backend called")
         try:
             # Check authentication first
             if not self.auth_manager.is_logged_in():
-                print("DEBUG: Not logged in")
+                log.debug("Not logged in")
                 self.sessions_status_label.setText("⚠️ Please login to view import history")
                 self.sessions_list.clear()
                 self.import_sessions = []
                 return
             
-            print("DEBUG: Fetching import sessions from API...")
+            log.debug("Fetching import sessions from API...")
             self.sessions_status_label.setText("Loading...")
             self.sessions_list.clear()
             QApplication.processEvents()
             
             # Fetch from backend API
             response = self.api_client.get_import_sessions(limit=100)
-            print(f"DEBUG: Full API response: {response}")
+            log.debug("Full API response: %s", response)
             # Backend returns {"sessions": [...], "total": N} not {"data": [...]}
             sessions_data = response.get('sessions', [])
-            print(f"DEBUG: sessions_data = {sessions_data}")
-            print(f"DEBUG: Received {len(sessions_data)} sessions from API")
-            print(f"DEBUG: Meta info: {response.get('meta', {})}")
+            log.debug("Received %d sessions from API, meta: %s",
+                      len(sessions_data), response.get('meta', {}))
             
             if not sessions_data:
                 self.sessions_status_label.setText(f"No imports in list (but {response.get('meta', {}).get('total', 0)} total exist)")
@@ -606,6 +619,7 @@ class ImportView(BaseView):
         self.progress_bar.setMaximum(len(self.scanned_files))
         self.progress_bar.setValue(0)
         
+        hothash_cache = HothashCache()
         try:
             # Create import session
             self.progress_label.setText("Creating import session...")
@@ -624,94 +638,111 @@ class ImportView(BaseView):
                 session_name=session_name
             )
             
-            # Process and import each file
-            for i, file_path in enumerate(self.scanned_files, 1):
-                filename = Path(file_path).name
-                self.progress_label.setText(f"Processing {i}/{len(self.scanned_files)}: {filename}")
-                self.progress_bar.setValue(i)
-                QApplication.processEvents()
-                
-                try:
-                    # Process image (EXIF + previews)
-                    image_data = self.scanner.process_image(file_path)
-                    print(f"DEBUG: Processed {filename} - error={image_data.error}, hotpreview={len(image_data.hotpreview_base64) if image_data.hotpreview_base64 else 0} bytes")  # DEBUG
-                    
-                    if image_data.error:
-                        print(f"ERROR: Image processing failed for {filename}: {image_data.error}")  # DEBUG
-                        summary.errors += 1
-                        summary.error_details.append({
-                            'file': filename,
-                            'error': image_data.error
-                        })
-                        continue
-                    
-                    # Validate hotpreview was generated
-                    if not image_data.hotpreview_base64:
-                        summary.errors += 1
-                        error_msg = "Failed to generate hotpreview"
-                        summary.error_details.append({
-                            'file': filename,
-                            'error': error_msg
-                        })
-                        continue
-                    
-                    # Import to backend
-                    self.progress_label.setText(f"Uploading {i}/{len(self.scanned_files)}: {filename}")
-                    QApplication.processEvents()
-                    
-                    print(f"DEBUG: Importing {filename} with session_id={session_id}")  # DEBUG
-                    
-                    try:
-                        photo_response = self.api_client.import_photo(
-                            filename=image_data.filename,
-                            hotpreview_base64=image_data.hotpreview_base64,
-                            file_size=image_data.file_size,
-                            session_id=session_id,
-                            taken_at=image_data.taken_at,
-                            gps_latitude=image_data.gps_latitude,
-                            gps_longitude=image_data.gps_longitude,
-                            exif_dict=image_data.get_exif_dict(),
-                        )
+            # Files imported before and unchanged since are skipped without
+            # decoding if the backend still has the photo
+            known, existing = self._find_existing(hothash_cache)
+            to_process = [p for p in self.scanned_files if known.get(p) not in existing]
+            
+            total = len(self.scanned_files)
+            completed = total - len(to_process)
+            for file_path in self.scanned_files:
+                if known.get(file_path) in existing:
+                    summary.duplicates += 1
+                    summary.duplicate_files.append(Path(file_path).name)
+            self.progress_bar.setValue(completed)
+            
+            # Process files in parallel - Pillow and socket I/O release the
+            # GIL - and upload them in batches (one bulk request each).
+            # Qt widgets and summary are only touched here.
+            # Copies of a photo (same hothash) are resolved here too: only the
+            # first is uploaded, later ones wait for its result. They become
+            # duplicates once it is imported, and the next copy is uploaded
+            # if it fails.
+            imported = set(existing)  # Hothashes the backend has
+            uploading = {}  # Hothash -> (copy being uploaded, later copies)
+            pending = set()
+            upload_futures = set()  # Futures returning a list of uploaded images
+            ready = []  # Processed images waiting for the next batch
+            files = iter(to_process)
+            files_left = True
+            
+            preview_pool = self._create_preview_pool()
+            try:
+                with ThreadPoolExecutor(max_workers=IMPORT_WORKERS) as executor:
+                    process_pool = preview_pool or executor
+                    while True:
+                        # Keep a bounded number of files in flight so previews
+                        # of finished files can be freed
+                        while files_left and len(pending) < IMPORT_WORKERS * 2:
+                            file_path = next(files, None)
+                            if file_path is None:
+                                files_left = False
+                            else:
+                                pending.add(process_pool.submit(self.scanner.process_image, file_path))
                         
-                        # Get hothash from response
-                        hothash = photo_response.get('photo_hothash')
+                        # Upload full batches, and the remainder once all files are processed
+                        processing = len(pending) - len(upload_futures)
+                        while ready and (len(ready) >= IMPORT_BATCH_SIZE
+                                         or (not files_left and processing == 0)):
+                            batch, ready = ready[:IMPORT_BATCH_SIZE], ready[IMPORT_BATCH_SIZE:]
+                            future = executor.submit(self._upload_batch, batch, session_id)
+                            upload_futures.add(future)
+                            pending.add(future)
+                        if not pending:
+                            break
                         
-                        # Upload coldpreview (non-critical - continue if it fails)
-                        if hothash and image_data.coldpreview_bytes:
-                            try:
-                                self.api_client.upload_coldpreview(
-                                    hothash,
-                                    image_data.coldpreview_bytes
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            finished = []
+                            if future not in upload_futures:
+                                image_data = future.result()  # Previews ready
+                                hothash = None if image_data.error else image_data.hothash
+                                if hothash in imported:
+                                    image_data.is_duplicate = True
+                                    finished.append(image_data)
+                                elif hothash in uploading:
+                                    uploading[hothash][1].append(image_data)
+                                else:
+                                    if hothash:
+                                        uploading[hothash] = (image_data, [])
+                                    ready.append(image_data)
+                            else:
+                                upload_futures.discard(future)
+                                for image_data in future.result():
+                                    finished.append(image_data)
+                                    first, later = uploading.get(image_data.hothash, (None, []))
+                                    if first is not image_data:
+                                        continue
+                                    del uploading[image_data.hothash]
+                                    if not image_data.error:
+                                        imported.add(image_data.hothash)
+                                        for copy in later:
+                                            copy.is_duplicate = True
+                                        finished.extend(later)
+                                    elif later:
+                                        # Upload failed - try the next copy
+                                        uploading[image_data.hothash] = (later[0], later[1:])
+                                        ready.append(later[0])
+                            
+                            for image_data in finished:
+                                completed += 1
+                                self._record_import_result(summary, image_data)
+                                if not image_data.error:
+                                    hothash_cache.set(image_data.file_path, image_data.file_mtime_ns,
+                                                      image_data.file_size, image_data.hothash)
+                                self.progress_label.setText(
+                                    f"Processed {completed}/{total}: {image_data.filename}"
                                 )
-                            except Exception as coldpreview_error:
-                                # Log but don't fail the import
-                                print(f"Warning: Failed to upload coldpreview for {filename}: {coldpreview_error}")
-                        
-                        summary.imported += 1
-                        
-                    except Exception as api_error:
-                        error_msg = str(api_error)
-                        print(f"ERROR: Failed to import {filename}: {error_msg}")  # DEBUG
-                        # Check if it's a duplicate (backend might return specific error)
-                        if 'already exists' in error_msg.lower() or 'duplicate' in error_msg.lower() or '409' in error_msg:
-                            summary.duplicates += 1
-                            summary.duplicate_files.append(filename)
-                        else:
-                            summary.errors += 1
-                            summary.error_details.append({
-                                'file': filename,
-                                'error': error_msg
-                            })
-                
-                except Exception as e:
-                    error_msg = str(e)
-                    print(f"ERROR: Exception during import of {filename}: {error_msg}")  # DEBUG
-                    summary.errors += 1
-                    summary.error_details.append({
-                        'file': filename,
-                        'error': error_msg
-                    })
-            
+                            self.progress_bar.setValue(completed)
+                        QApplication.processEvents()
+            finally:
+                if preview_pool:
+                    preview_pool.shutdown(cancel_futures=True)
+
+            # Workers finish in any order - keep the report stable across runs
+            summary.error_details.sort(key=lambda detail: (detail['file'], detail['error']))
+            summary.duplicate_files.sort()
+
             # Show summary
             self._show_import_summary(summary)
             
@@ -731,12 +762,179 @@ class ImportView(BaseView):
             )
         
         finally:
+            hothash_cache.save()
+            
             # Re-enable UI
             self.import_btn.setEnabled(False)
             self.scan_btn.setEnabled(True)
             self.progress_bar.setVisible(False)
             self.progress_label.setText("")
     
+    def _find_existing(self, hothash_cache: HothashCache):
+        """
+        Find scanned files the backend already has, from the hothash cache.
+        
+        The lookup (a stat() per cached file) and the existence check (one
+        request per photo on backends without exists-batch) run in a worker
+        thread while the event loop keeps running.
+        
+        Returns:
+            (file path -> cached hothash, set of those hothashes that exist)
+        """
+        checked = [0]
+        totals = [0]
+        
+        def check():
+            known = hothash_cache.lookup(self.scanned_files)
+            hothashes = sorted(set(known.values()))
+            totals[0] = len(hothashes)
+            existing = set()
+            if hothashes:
+                try:
+                    existing = self.api_client.existing_hothashes(
+                        hothashes, progress_callback=lambda n: checked.__setitem__(0, n)
+                    )
+                except Exception as e:
+                    log.warning("Could not check previously imported files: %s", e)
+            return known, existing
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(check)
+            while not future.done():
+                text = "Checking previously imported files..."
+                if totals[0]:
+                    text += f" {checked[0]}/{totals[0]}"
+                self.progress_label.setText(text)
+                QApplication.processEvents()
+                wait([future], timeout=0.05)
+            return future.result()
+    
+    def _create_preview_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Create process pool for preview generation if enabled.
+        
+        Opt-in with IMALINK_IMPORT_PROCESSES=1: sidesteps the GIL for the
+        Python-level parts of EXIF extraction and preview generation, at
+        the cost of starting worker processes per import. Workers are never
+        forked from the UI process - forking a process running Qt threads
+        is unsafe. Where available they fork from a forkserver that has the
+        scanner (Pillow, EXIF) preloaded, otherwise they are spawned. Both
+        re-import main.py as __mp_main__, which keeps its Qt/UI imports
+        inside main() so workers stay Qt-free.
+        
+        Returns:
+            ProcessPoolExecutor, or None to process files in upload threads
+        """
+        if not os.environ.get("IMALINK_IMPORT_PROCESSES"):
+            return None
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload([ImportScanner.__module__])
+        else:
+            context = multiprocessing.get_context("spawn")
+        return ProcessPoolExecutor(max_workers=IMPORT_WORKERS, mp_context=context)
+    
+    def _upload_batch(self, images: List[ImageImportData], session_id: int) -> List[ImageImportData]:
+        """
+        Upload processed images (photos + coldpreviews) to the backend.
+        
+        Photos go out in one bulk request (APIClient.import_photos_batch),
+        coldpreviews are uploaded in parallel afterwards.
+        Runs in a worker thread - must not touch Qt widgets.
+        
+        Args:
+            images: Results of ImportScanner.process_image()
+            session_id: Backend import session id
+        
+        Returns:
+            The same images, with error / is_duplicate set on failure
+        """
+        to_upload = []
+        for image_data in images:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Processed %s - error=%s, hotpreview=%d bytes", image_data.filename,
+                          image_data.error, len(image_data.hotpreview_base64 or ''))
+            
+            if image_data.error:
+                log.error("Image processing failed for %s: %s", image_data.filename, image_data.error)
+                continue
+            
+            # Validate hotpreview was generated
+            if not image_data.hotpreview_base64:
+                image_data.error = "Failed to generate hotpreview"
+                continue
+            to_upload.append(image_data)
+        
+        if not to_upload:
+            return images
+        
+        log.debug("Importing %d photos with session_id=%s", len(to_upload), session_id)
+        try:
+            results = self.api_client.import_photos_batch([
+                {
+                    "filename": image_data.filename,
+                    "hotpreview_base64": image_data.hotpreview_base64,
+                    "file_size": image_data.file_size,
+                    "session_id": session_id,
+                    "taken_at": image_data.taken_at,
+                    "gps_latitude": image_data.gps_latitude,
+                    "gps_longitude": image_data.gps_longitude,
+                    "exif_dict": image_data.get_exif_dict(),
+                    "hotpreview_bytes": image_data.hotpreview_bytes,
+                }
+                for image_data in to_upload
+            ], batch_size=len(to_upload))
+        except Exception as e:
+            results = [{"error": str(e)}] * len(to_upload)
+        
+        coldpreviews = []
+        for image_data, result in zip(to_upload, results):
+            error_msg = result.get("error")
+            if error_msg:
+                log.error("Failed to import %s: %s", image_data.filename, error_msg)
+                # Check if it's a duplicate (backend might return specific error)
+                lowered = error_msg.lower()
+                if 'already exists' in lowered or 'duplicate' in lowered or '409' in error_msg:
+                    image_data.is_duplicate = True
+                else:
+                    image_data.error = error_msg
+                continue
+            
+            hothash = result.get('photo_hothash')
+            if hothash and image_data.coldpreview_bytes:
+                coldpreviews.append((image_data, hothash))
+        
+        # Coldpreview upload is non-critical - log failures, keep the import
+        if coldpreviews:
+            with ThreadPoolExecutor(max_workers=min(IMPORT_WORKERS, len(coldpreviews))) as executor:
+                futures = {
+                    executor.submit(self.api_client.upload_coldpreview, hothash,
+                                    image_data.coldpreview_bytes): image_data
+                    for image_data, hothash in coldpreviews
+                }
+                for future, image_data in futures.items():
+                    try:
+                        future.result()
+                    except Exception as coldpreview_error:
+                        log.warning("Failed to upload coldpreview for %s: %s",
+                                    image_data.filename, coldpreview_error)
+        
+        return images
+    
+    def _record_import_result(self, summary: ImportSummary, image_data: ImageImportData):
+        """Add the outcome of one imported file to the summary"""
+        if image_data.error:
+            summary.errors += 1
+            summary.error_details.append({
+                'file': image_data.filename,
+                'error': image_data.error
+            })
+        elif image_data.is_duplicate:
+            summary.duplicates += 1
+            summary.duplicate_files.append(image_data.filename)
+        else:
+            summary.imported += 1
+    
     def _show_import_summary(self, summary: ImportSummary):
         """Show import summary dialog"""
         msg = QMessageBox(self)
@@ -784,7 +982,7 @@ class ImportView(BaseView):
     
     def on_show(self):
         """Called when view is shown - load import sessions"""
-        print("DEBUG: ImportView.on_show() called")
+        log.debug("ImportView.on_show() called")
         self.status_info.emit("Import photos")
         # Load import sessions from backend (always fresh data)
         self._load_sessions_from_backend()
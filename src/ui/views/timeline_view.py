@@ -1,7 +1,7 @@
 """Timeline View - Hierarchical date-based photo browser"""
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget,
                                QTreeWidgetItem, QPushButton, QLabel, QScrollArea, QFrame, QSizePolicy)
-from PySide6.QtCore import Qt, Signal, QSize, QBuffer, QIODevice, QByteArray
+from PySide6.QtCore import Qt, Signal, QSize
 from PySide6.QtGui import QPixmap, QIcon, QCursor, Qt as QtGui
 from datetime import date, datetime
 from typing import Optional
@@ -13,6 +13,23 @@ from ...models.timeline_data import TimelineYear, TimelineMonth, TimelineDay, Ti
 from ...models.search_data import PhotoSearchCriteria
 
 
+def _preview_tooltip(image_bytes: bytes, size: Optional[QSize] = None) -> str:
+    """
+    Build HTML tooltip showing a hotpreview.
+    
+    Embeds the downloaded JPEG as-is instead of re-encoding a QPixmap as
+    PNG; the rich text engine does any scaling when the tooltip is shown.
+    
+    Args:
+        image_bytes: Hotpreview JPEG bytes
+        size: Display size (default: image size)
+    """
+    data = base64.b64encode(image_bytes).decode('ascii')
+    if size is None:
+        return f"<img src='data:image/jpeg;base64,{data}'/>"
+    return f"<img src='data:image/jpeg;base64,{data}' width='{size.width()}' height='{size.height()}'/>"
+
+
 class FlowLayout(QHBoxLayout):
     """Simple horizontal flow layout that wraps widgets"""
     def __init__(self, parent=None, spacing=5):
@@ -72,10 +89,11 @@ class PhotoGridWidget(QWidget):
             label.setFixedSize(50, 50)
             label.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
             
-            # Store full-size pixmap for tooltip
-            full_pixmap = pixmap.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            tooltip_base64 = self._pixmap_to_base64(full_pixmap)
-            label.setToolTip(f"<img src='data:image/png;base64,{tooltip_base64}'/>")
+            # Tooltip with larger preview (up to 300x300)
+            label.setToolTip(_preview_tooltip(
+                hotpreview_data,
+                pixmap.size().scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio)
+            ))
             
             return label
             
@@ -83,12 +101,6 @@ class PhotoGridWidget(QWidget):
             print(f"[Timeline] Error creating photo label: {e}")
             return None
     
-    def _pixmap_to_base64(self, pixmap: QPixmap) -> str:
-        """Convert QPixmap to base64 string for HTML embedding"""
-        byte_array = QBuffer()
-        byte_array.open(QIODevice.OpenModeFlag.WriteOnly)
-        pixmap.save(byte_array, "PNG")
-        return base64.b64encode(byte_array.data().data()).decode('utf-8')
 
 
 class TimelineView(BaseView):
@@ -160,10 +172,10 @@ class TimelineView(BaseView):
         # Always load years when view is shown
         self._load_years()
     
-    def _load_thumbnail_icon(self, photo_data: dict) -> tuple[Optional[QIcon], Optional[QPixmap]]:
+    def _load_thumbnail_icon(self, photo_data: dict) -> tuple[Optional[QIcon], Optional[str]]:
         """
-        Load thumbnail from photo data and return as (icon, full_pixmap).
-        Icon is scaled to 50x50, full_pixmap is original size for tooltip.
+        Load thumbnail from photo data and return as (icon, tooltip).
+        Icon is scaled to 50x50, tooltip shows the hotpreview at original size.
         """
         try:
             hothash = photo_data.get('hothash')
@@ -191,20 +203,12 @@ class TimelineView(BaseView):
             
             print(f"[Timeline] Scaled pixmap: {small_pixmap.width()}x{small_pixmap.height()}")
             
-            return QIcon(small_pixmap), full_pixmap
+            return QIcon(small_pixmap), _preview_tooltip(image_bytes)
         except Exception as e:
             print(f"[Timeline] Failed to load thumbnail: {e}")
         
         return None, None
     
-    def _pixmap_to_base64(self, pixmap: QPixmap) -> str:
-        """Convert QPixmap to base64 string for HTML tooltip"""
-        buffer = QBuffer()
-        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-        pixmap.save(buffer, "PNG")
-        buffer.close()
-        return base64.b64encode(buffer.data().data()).decode()
-    
     def _load_years(self):
         """Load year-level aggregation - show only years with photos"""
         self.status_info.emit("Loading timeline...")
@@ -243,12 +247,11 @@ class TimelineView(BaseView):
                         photos = response.get('data', [])
                         print(f"[Timeline] Response data for year {year}: {len(photos)} photos, first: {photos[0] if photos else 'NONE'}")
                         if photos and photos[0]:
-                            icon, full_pixmap = self._load_thumbnail_icon(photos[0])
+                            icon, tooltip = self._load_thumbnail_icon(photos[0])
                             if icon:
                                 item.setIcon(0, icon)
                                 # Set tooltip with full-size image
-                                if full_pixmap:
-                                    item.setToolTip(0, f"<img src='data:image/png;base64,{self._pixmap_to_base64(full_pixmap)}'/>")
+                                item.setToolTip(0, tooltip)
                         
                         # Add dummy child to show expand arrow
                         dummy = QTreeWidgetItem(["Loading..."])
@@ -341,12 +344,11 @@ class TimelineView(BaseView):
                         # Try to load thumbnail from the sample photo
                         photos = response.get('data', [])
                         if photos:
-                            icon, full_pixmap = self._load_thumbnail_icon(photos[0])
+                            icon, tooltip = self._load_thumbnail_icon(photos[0])
                             if icon:
                                 month_item.setIcon(0, icon)
                                 # Set tooltip with full-size image
-                                if full_pixmap:
-                                    month_item.setToolTip(0, f"<img src='data:image/png;base64,{self._pixmap_to_base64(full_pixmap)}'/>")
+                                month_item.setToolTip(0, tooltip)
                         
                         # Add dummy child so expand arrow shows
                         dummy = QTreeWidgetItem(["Loading..."])
@@ -407,12 +409,11 @@ class TimelineView(BaseView):
                         # Try to load thumbnail from the sample photo
                         photos = response.get('data', [])
                         if photos:
-                            icon, full_pixmap = self._load_thumbnail_icon(photos[0])
+                            icon, tooltip = self._load_thumbnail_icon(photos[0])
                             if icon:
                                 day_item.setIcon(0, icon)
                                 # Set tooltip with full-size image
-                                if full_pixmap:
-                                    day_item.setToolTip(0, f"<img src='data:image/png;base64,{self._pixmap_to_base64(full_pixmap)}'/>")
+                                day_item.setToolTip(0, tooltip)
                         
                         # Add dummy child so expand arrow shows
                         dummy = QTreeWidgetItem(["Loading..."])
@@ -468,12 +469,11 @@ class TimelineView(BaseView):
                         # Try to load thumbnail from the sample photo
                         photos = response.get('data', [])
                         if photos:
-                            icon, full_pixmap = self._load_thumbnail_icon(photos[0])
+                            icon, tooltip = self._load_thumbnail_icon(photos[0])
                             if icon:
                                 hour_item.setIcon(0, icon)
                                 # Set tooltip with full-size image
-                                if full_pixmap:
-                                    hour_item.setToolTip(0, f"<img src='data:image/png;base64,{self._pixmap_to_base64(full_pixmap)}'/>")
+                                hour_item.setToolTip(0, tooltip)
                         
                         # Add dummy child so expand arrow shows
                         dummy = QTreeWidgetItem(["Loading..."])
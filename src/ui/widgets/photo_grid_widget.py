@@ -132,19 +132,16 @@ class PhotoGridWidget(QWidget):
         QApplication.processEvents()
         
         try:
-            # Get all photos from API
-            response = self.api_client.get_photos(limit=500)
-            all_photos_dict = response.get('data', [])
-            
-            # Convert API dicts to PhotoModel objects
-            all_photos = [PhotoModel.from_dict(p) for p in all_photos_dict]
+            # Get photos from API, converting API dicts to PhotoModel objects
+            # while they stream in (no full page of dicts kept around)
+            all_photos = (PhotoModel.from_dict(p) for p in self.api_client.iter_photos(limit=500))
             
             # Filter by import_session_id if specified
             if import_session_id is not None:
                 filtered_photos = [p for p in all_photos 
                                   if p.import_session_id == import_session_id]
             else:
-                filtered_photos = all_photos
+                filtered_photos = list(all_photos)
             
             self.photos = filtered_photos
             
@@ -327,25 +324,22 @@ class PhotoGridWidget(QWidget):
             print(f"[PhotoGridWidget] {error_text}")
     
     def _load_thumbnails(self):
-        """Load thumbnail images for all photos"""
-        total = len(self.photos)
+        """Load thumbnail images for all photos (fetched in parallel)"""
+        # Skip already cached thumbnails
+        missing = [photo.hothash for photo in self.photos
+                   if not self.cache.get_thumbnail(photo.hothash)]
+        total = len(missing)
         
-        for i, photo in enumerate(self.photos):
-            # Check if already cached
-            if self.cache.get_thumbnail(photo.hothash):
-                continue
-            
+        for i, (hothash, image_data) in enumerate(self.api_client.get_hotpreviews(missing)):
             # Update status
             self.status_label.setText(f"Loading thumbnails... {i+1}/{total}")
             self.status_changed.emit(f"Loading thumbnails... {i+1}/{total}")
             QApplication.processEvents()
             
-            try:
-                # Load thumbnail directly
-                image_data = self.api_client.get_hotpreview(photo.hothash)
-                self.cache.set_thumbnail(photo.hothash, image_data)
-            except Exception as e:
-                print(f"Failed to load thumbnail {photo.hothash}: {e}")
+            if image_data is None:
+                print(f"Failed to load thumbnail {hothash}")
+                continue
+            self.cache.set_thumbnail(hothash, image_data)
     
     def refresh_view(self):
         """COMPLETE REBUILD: Delete all widgets, create new from self.photos data"""
@@ -523,14 +517,15 @@ class PhotoGridWidget(QWidget):
         drag.setMimeData(mime_data)
         
         # Create drag pixmap showing count
-        from PySide6.QtGui import QPainter, QFont, QColor
+        from PySide6.QtGui import QPainter, QFont
         from PySide6.QtCore import QRect
+        from ..palette import Palette
         
         pixmap = QPixmap(120, 80)
-        pixmap.fill(QColor(0, 120, 212, 200))  # Semi-transparent blue
+        pixmap.fill(Palette.DRAG_BACKGROUND)
         
         painter = QPainter(pixmap)
-        painter.setPen(QColor(255, 255, 255))
+        painter.setPen(Palette.WHITE)
         
         # Draw count
         font = QFont("Arial", 24, QFont.Bold)
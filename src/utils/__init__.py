@@ -17,6 +17,7 @@ from .image_utils import (
 from .preview_generator import (
     generate_hotpreview_and_hash,
     generate_coldpreview,
+    generate_previews,
 )
 
 __all__ = [
@@ -30,4 +31,5 @@ __all__ = [
     'calculate_file_hash',
     'generate_hotpreview_and_hash',
     'generate_coldpreview',
+    'generate_previews',
 ]
@@ -0,0 +1,65 @@
+"""
+Optional ctypes binding to the system libbase64 (aklomp/base64)
+
+libbase64 picks an SSSE3/AVX2/AVX-512/NEON codec at runtime. Used for
+hotpreview base64 encoding when pybase64 is not installed.
+
+Importing this module raises ImportError if the library is not available
+or does not produce the same output as the standard library.
+"""
+
+import base64
+import ctypes
+
+
+# Only the ABI whose base64_encode signature is declared below
+SONAME = "libbase64.so.0"
+
+
+def _load_library() -> ctypes.CDLL:
+    """Load libbase64 by its versioned soname"""
+    try:
+        return ctypes.CDLL(SONAME)
+    except OSError:
+        raise ImportError(f"{SONAME} not found") from None
+
+
+_lib = _load_library()
+
+# void base64_encode(const char *src, size_t srclen,
+#                    char *out, size_t *outlen, int flags)
+_lib.base64_encode.argtypes = [
+    ctypes.c_char_p,
+    ctypes.c_size_t,
+    ctypes.c_char_p,
+    ctypes.POINTER(ctypes.c_size_t),
+    ctypes.c_int,
+]
+_lib.base64_encode.restype = None
+
+
+def b64encode(data: bytes) -> bytes:
+    """
+    Base64-encode data (same output as base64.b64encode).
+
+    Args:
+        data: Bytes to encode
+
+    Returns:
+        Base64-encoded bytes
+    """
+    out = ctypes.create_string_buffer((len(data) + 2) // 3 * 4 + 1)
+    outlen = ctypes.c_size_t(0)
+    _lib.base64_encode(data, len(data), out, ctypes.byref(outlen), 0)
+    return out.raw[:outlen.value]
+
+
+def _self_check():
+    """Compare against base64.b64encode once, covering every byte and padding"""
+    sample = bytes(range(256)) * 4
+    for length in (0, 1, 2, 3, 64, len(sample)):
+        if b64encode(sample[:length]) != base64.b64encode(sample[:length]):
+            raise ImportError(f"{SONAME} output differs from base64.b64encode")
+
+
+_self_check()
@@ -223,9 +223,6 @@ def extract_gps_from_exif(exif) -> Tuple[Optional[float], Optional[float]]:
         (latitude, longitude) tuple, or (None, None) if not found/invalid
     """
     try:
-        # Get GPS IFD using modern PIL method
-        from PIL.ExifTags import GPSTAGS
-        
         # Try to get GPS IFD (tag 34853)
         try:
             gps_ifd = exif.get_ifd(0x8825)  # 0x8825 = 34853 = GPSInfo
@@ -3,10 +3,12 @@ Image processing and utility functions
 """
 
 from PIL import Image, ImageOps
+from io import BytesIO
 from pathlib import Path
 from typing import Tuple, Optional, List
 import hashlib
 import mimetypes
+import os
 
 
 def get_image_info(file_path: str) -> dict:
@@ -55,7 +57,6 @@ def create_thumbnail(file_path: str, size: Tuple[int, int] = (150, 150),
                 img = img.convert('RGB')
             
             # Save to bytes
-            from io import BytesIO
             buffer = BytesIO()
             img.save(buffer, format='JPEG', quality=quality, optimize=True)
             return buffer.getvalue()
@@ -66,11 +67,12 @@ def create_thumbnail(file_path: str, size: Tuple[int, int] = (150, 150),
 
 def calculate_file_hash(file_path: str, algorithm: str = 'sha256') -> str:
     """Calculate hash of a file"""
-    hash_func = hashlib.new(algorithm)
-    
     try:
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b""):
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+: hashes in C
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            hash_func = hashlib.new(algorithm, usedforsecurity=False)
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
                 hash_func.update(chunk)
         return hash_func.hexdigest()
     
@@ -142,7 +144,6 @@ def resize_image_smart(file_path: str, max_width: int, max_height: int,
                 img = img.convert('RGB')
             
             # Save to bytes
-            from io import BytesIO
             buffer = BytesIO()
             img.save(buffer, format='JPEG', quality=quality, optimize=True)
             return buffer.getvalue()
@@ -159,11 +160,24 @@ def scan_directory_for_images(directory: str, recursive: bool = True) -> List[st
     if not directory.exists() or not directory.is_dir():
         return image_files
     
-    pattern = "**/*" if recursive else "*"
-    
-    for file_path in directory.glob(pattern):
-        if file_path.is_file() and is_supported_image(str(file_path)):
-            image_files.append(str(file_path.absolute()))
+    # os.scandir gets the file type from the directory listing, so unlike
+    # Path.glob() + is_file() this does not stat() every file. The import
+    # stats each file once later (ImportScanner.process_image).
+    pending = [os.path.abspath(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        if is_supported_image(entry.path):
+                            image_files.append(entry.path)
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+        except OSError:
+            # Unreadable directory (lost+found, .Trash-1000, ...) - skip it
+            # like Path.glob() did instead of aborting the whole scan
+            continue
     
     return sorted(image_files)
 
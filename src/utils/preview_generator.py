@@ -4,13 +4,87 @@ Preview generation utilities for ImaLink
 Generates hotpreview (150x150) and coldpreview (1200px) thumbnails with hothash.
 """
 
-import base64
 import hashlib
 from io import BytesIO
-from typing import Tuple
+from typing import Optional, Tuple
 
 from PIL import Image, ImageOps
 
+# SIMD base64 is optional - pybase64, then system libbase64, then stdlib
+# (all give identical output)
+try:
+    from pybase64 import b64encode
+except ImportError:
+    try:
+        from ._base64simd import b64encode
+    except ImportError:
+        from base64 import b64encode
+
+
+def _open_oriented(file_path: str, draft_size: Optional[int] = None) -> Tuple[Image.Image, bool]:
+    """
+    Open an image and rotate its pixels based on the EXIF Orientation tag.
+    
+    NOTE: exif_transpose() reads the Orientation tag and rotates the pixel
+    data. It runs in place, so the common Orientation=1 case does not copy
+    the full-size raster; the image is always fully decoded on return.
+    
+    Args:
+        file_path: Path to image file
+        draft_size: Let libjpeg scale down while decoding so the result is
+            still >= draft_size (no-op for non-JPEG). Must not be used for
+            hotpreview: it would change the hothash of imported photos.
+        
+    Returns:
+        Tuple of (image, oriented) - oriented is False if exif_transpose failed
+    """
+    img = Image.open(file_path)
+    if draft_size:
+        img.draft("RGB", (draft_size, draft_size))
+    try:
+        # Decode before transposing: thumbnail() on an unloaded image would
+        # draft-decode it and change the hotpreview (and hothash)
+        img.load()
+        ImageOps.exif_transpose(img, in_place=True)
+        return img, True
+    except Exception:
+        return img, False  # No EXIF orientation tag or already correctly oriented
+
+
+def _encode_jpeg(img: Image.Image) -> bytes:
+    """Encode image as JPEG (quality 85, no EXIF metadata)"""
+    # NOTE: getvalue() hands over BytesIO's internal bytes object without a
+    # copy as long as no buffer views are exported, so callers hashing and
+    # base64-encoding the result both read that single buffer (don't switch
+    # to getbuffer() here). A fresh BytesIO per call is deliberate for the
+    # same reason: reusing a buffer across calls forces a copy out every call.
+    # convert() to the same mode still copies the whole image - skip it
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    buffer = BytesIO()
+    img.save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+def _hotpreview_from_image(img: Image.Image) -> Tuple[bytes, str, str]:
+    """
+    Build hotpreview, base64 and hothash from an oriented full-size image.
+    
+    Thumbnails img in place.
+    """
+    # Generate 150x150 thumbnail (maintains aspect ratio)
+    img.thumbnail((150, 150), Image.Resampling.LANCZOS)
+    hotpreview_bytes = _encode_jpeg(img)
+    
+    # Generate hothash (SHA256 of hotpreview bytes)
+    # Content identifier, not a security primitive - skip FIPS-mode checks
+    hothash = hashlib.sha256(hotpreview_bytes, usedforsecurity=False).hexdigest()
+    
+    # Base64 encode for API transmission (output is pure ASCII)
+    hotpreview_b64 = b64encode(hotpreview_bytes).decode("ascii")
+    
+    return hotpreview_bytes, hotpreview_b64, hothash
+
 
 def generate_hotpreview_and_hash(file_path: str) -> Tuple[bytes, str, str]:
     """
@@ -45,30 +119,8 @@ def generate_hotpreview_and_hash(file_path: str) -> Tuple[bytes, str, str]:
         >>> # Hotpreview has no EXIF - extract separately:
         >>> metadata = extract_basic_metadata("photo.jpg")
     """
-    # Open image and rotate pixels based on EXIF Orientation tag
-    # NOTE: exif_transpose() reads the Orientation tag, rotates the pixel data,
-    # and returns an image with correct orientation but NO EXIF metadata
-    img = Image.open(file_path)
-    try:
-        img = ImageOps.exif_transpose(img)
-    except Exception:
-        pass  # No EXIF orientation tag or already correctly oriented
-    
-    # Generate 150x150 thumbnail (maintains aspect ratio)
-    img.thumbnail((150, 150), Image.Resampling.LANCZOS)
-    
-    # Convert to JPEG bytes
-    buffer = BytesIO()
-    img.convert("RGB").save(buffer, format="JPEG", quality=85)
-    hotpreview_bytes = buffer.getvalue()
-    
-    # Generate hothash (SHA256 of hotpreview bytes)
-    hothash = hashlib.sha256(hotpreview_bytes).hexdigest()
-    
-    # Base64 encode for API transmission
-    hotpreview_b64 = base64.b64encode(hotpreview_bytes).decode()
-    
-    return hotpreview_bytes, hotpreview_b64, hothash
+    img, _ = _open_oriented(file_path)
+    return _hotpreview_from_image(img)
 
 
 def generate_coldpreview(file_path: str, max_size: int = 1200) -> bytes:
@@ -83,7 +135,7 @@ def generate_coldpreview(file_path: str, max_size: int = 1200) -> bytes:
     correctly rotated pixel data but no EXIF metadata.
     
     Process:
-    1. Opens image from file
+    1. Opens image from file (JPEGs are decoded at reduced scale when possible)
     2. Rotates pixels based on EXIF Orientation tag
     3. Scales to max_size maintaining aspect ratio
     4. Saves as JPEG with no EXIF metadata
@@ -101,19 +153,43 @@ def generate_coldpreview(file_path: str, max_size: int = 1200) -> bytes:
         ...     f.write(coldpreview_bytes)
         >>> # Preview is correctly rotated but has no EXIF
     """
-    # Open image and rotate pixels based on EXIF Orientation tag
-    # NOTE: exif_transpose() ensures correct orientation but strips EXIF
-    img = Image.open(file_path)
-    try:
-        img = ImageOps.exif_transpose(img)
-    except Exception:
-        pass  # No EXIF orientation tag or already correctly oriented
+    # JPEGs are decoded at 1/2, 1/4 or 1/8 scale when still >= max_size;
+    # LANCZOS does the final resize
+    img, _ = _open_oriented(file_path, draft_size=max_size)
     
     # Resize to max dimension while maintaining aspect ratio
     img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
     
-    # Convert to JPEG bytes with 85% quality
-    buffer = BytesIO()
-    img.convert("RGB").save(buffer, format="JPEG", quality=85)
+    return _encode_jpeg(img)
+
+
+def generate_previews(file_path: str, cold_max_size: int = 1200) -> Tuple[bytes, str, str, bytes]:
+    """
+    Generate hotpreview, hothash and coldpreview from a single decode.
     
-    return buffer.getvalue()
+    Produces exactly the same hotpreview (and hothash) as
+    generate_hotpreview_and_hash(). The coldpreview is resized from the
+    same full-size decode instead of a reduced-scale draft, so the file
+    is decoded once instead of twice.
+    
+    Args:
+        file_path: Path to image file
+        cold_max_size: Maximum coldpreview dimension in pixels (default 1200)
+        
+    Returns:
+        Tuple of (hotpreview_bytes, hotpreview_base64, hothash, coldpreview_bytes)
+    """
+    img, oriented = _open_oriented(file_path)
+    if not oriented:
+        # Image may not be loaded, so thumbnail() may draft-decode it - keep
+        # the hotpreview pipeline identical by generating both separately
+        return (*_hotpreview_from_image(img), generate_coldpreview(file_path, cold_max_size))
+    
+    # Coldpreview first: resize() returns a new image and leaves img intact
+    scale = min(cold_max_size / img.width, cold_max_size / img.height, 1.0)
+    cold_size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+    coldpreview_bytes = _encode_jpeg(
+        img.resize(cold_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+    )
+    
+    return (*_hotpreview_from_image(img), coldpreview_bytes)
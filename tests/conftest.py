@@ -0,0 +1,73 @@
+"""Shared pytest setup - makes the src package importable from tests/"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        import requests
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class FakeSession:
+    """
+    Records requests and answers them with handler(method, url, kwargs).
+
+    Covers the session methods APIClient uses.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.handler(method, url, kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def api_client(tmp_path):
+    """
+    APIClient with a FakeSession (set client.session.handler per test) and
+    its coldpreview disk cache in tmp_path.
+    """
+    from src.api.client import APIClient
+    from src.api.preview_cache import PreviewDiskCache
+
+    client = APIClient("http://backend", multipart_import=False, http2=False, gzip_requests=False)
+    client.session = FakeSession(lambda method, url, kwargs: FakeResponse(404))
+    client._coldpreview_disk = PreviewDiskCache(str(tmp_path / "coldpreviews"))
+    return client
@@ -0,0 +1,530 @@
+"""Tests for APIClient request handling (no backend - FakeSession)"""
+import base64
+import gzip
+import json
+
+import pytest
+
+from conftest import FakeResponse
+
+
+def _photo(name, **extra):
+    return {"filename": name, "hotpreview_base64": "aG90", "session_id": 7, **extra}
+
+
+def _body(kwargs):
+    """Decoded JSON body of a recorded request"""
+    data = kwargs["data"]
+    if kwargs["headers"].get("Content-Encoding") == "gzip":
+        data = gzip.decompress(data)
+    return json.loads(data)
+
+
+def _bulk_echo(method, url, kwargs):
+    """Bulk endpoint answering one result per photo"""
+    payloads = _body(kwargs)
+    return FakeResponse(200, json.dumps([{"photo_hothash": p["filename"]} for p in payloads]).encode())
+
+
+def test_import_photos_batch_one_request_per_batch(api_client):
+    api_client.session.handler = _bulk_echo
+
+    results = api_client.import_photos_batch([_photo(f"{i}.jpg") for i in range(5)], batch_size=2)
+
+    assert [r["photo_hothash"] for r in results] == [f"{i}.jpg" for i in range(5)]
+    assert [url for _, url, _ in api_client.session.calls] == ["http://backend/api/v1/photos/new-photo/bulk"] * 3
+    first = _body(api_client.session.calls[0][2])
+    assert first[0] == {"filename": "0.jpg", "hotpreview": "aG90", "import_session_id": 7}
+
+
+def test_import_photos_batch_encodes_hotpreview_bytes(api_client):
+    api_client.session.handler = _bulk_echo
+
+    api_client.import_photos_batch([{"filename": "a.jpg", "hotpreview_bytes": b"\xff\xd8jpeg"}])
+
+    payload = _body(api_client.session.calls[0][2])[0]
+    assert base64.b64decode(payload["hotpreview"]) == b"\xff\xd8jpeg"
+
+
+def test_import_photos_batch_requires_hotpreview(api_client):
+    with pytest.raises(ValueError):
+        api_client.import_photos_batch([_photo("a.jpg"), {"filename": "b.jpg"}])
+    assert api_client.session.calls == []
+
+
+@pytest.mark.parametrize("status", [404, 405])
+def test_import_photos_batch_falls_back_to_single_imports(api_client, status):
+    def handler(method, url, kwargs):
+        if url.endswith("/bulk"):
+            return FakeResponse(status)
+        payload = _body(kwargs)
+        if payload["filename"] == "bad.jpg":
+            return FakeResponse(400)
+        return FakeResponse(200, json.dumps({"photo_hothash": payload["filename"]}).encode())
+    api_client.session.handler = handler
+
+    photos = [_photo("a.jpg"), _photo("bad.jpg"), {"filename": "c.jpg", "hotpreview_bytes": b"jpeg"}]
+    results = api_client.import_photos_batch(photos)
+
+    assert results[0] == {"photo_hothash": "a.jpg"}
+    assert "400" in results[1]["error"]
+    assert results[2] == {"photo_hothash": "c.jpg"}
+
+    # Unsupported endpoint is remembered - no second bulk attempt
+    api_client.session.calls.clear()
+    assert api_client.import_photos_batch([_photo("d.jpg")]) == [{"photo_hothash": "d.jpg"}]
+    assert [url for _, url, _ in api_client.session.calls] == ["http://backend/api/v1/photos/new-photo"]
+
+
+def test_import_photos_batch_keeps_earlier_results_on_failure(api_client):
+    def handler(method, url, kwargs):
+        if _body(kwargs)[0]["filename"] == "2.jpg":
+            return FakeResponse(503)
+        return _bulk_echo(method, url, kwargs)
+    api_client.session.handler = handler
+
+    results = api_client.import_photos_batch([_photo(f"{i}.jpg") for i in range(6)], batch_size=2)
+
+    assert [r.get("photo_hothash") for r in results] == ["0.jpg", "1.jpg", None, None, "4.jpg", "5.jpg"]
+    assert "503" in results[2]["error"] and "503" in results[3]["error"]
+
+
+def test_import_photos_batch_gzips_large_bodies(api_client, monkeypatch):
+    from src.api import client as client_module
+    monkeypatch.setattr(client_module, "GZIP_MIN_SIZE", 10)
+    api_client.session.handler = _bulk_echo
+
+    api_client.import_photos_batch([_photo("a.jpg")])
+    assert "Content-Encoding" not in api_client.session.calls[0][2]["headers"]  # Opt-in
+
+    api_client.gzip_requests = True
+    api_client.import_photos_batch([_photo("b.jpg")])
+
+    kwargs = api_client.session.calls[1][2]
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert _body(kwargs)[0]["filename"] == "b.jpg"
+
+
+@pytest.mark.parametrize("status", [400, 415, 422])
+def test_import_photos_batch_resends_rejected_gzip_uncompressed(api_client, monkeypatch, status):
+    from src.api import client as client_module
+    monkeypatch.setattr(client_module, "GZIP_MIN_SIZE", 10)
+    api_client.gzip_requests = True
+
+    def handler(method, url, kwargs):
+        if kwargs["headers"].get("Content-Encoding") == "gzip":
+            return FakeResponse(status)
+        return _bulk_echo(method, url, kwargs)
+    api_client.session.handler = handler
+
+    assert api_client.import_photos_batch([_photo("a.jpg")]) == [{"photo_hothash": "a.jpg"}]
+    assert api_client.gzip_requests is False
+    assert api_client._bulk_import_supported is True
+
+    api_client.session.calls.clear()
+    api_client.import_photos_batch([_photo("b.jpg")])
+    assert len(api_client.session.calls) == 1
+
+
+@pytest.mark.parametrize("status", [415, 422])
+def test_import_photos_batch_rejected_batch_falls_back_to_single_imports(api_client, status):
+    def handler(method, url, kwargs):
+        if url.endswith("/bulk"):
+            return FakeResponse(status)
+        return FakeResponse(200, json.dumps({"photo_hothash": _body(kwargs)["filename"]}).encode())
+    api_client.session.handler = handler
+
+    results = api_client.import_photos_batch([_photo("a.jpg"), _photo("b.jpg")])
+
+    assert results == [{"photo_hothash": "a.jpg"}, {"photo_hothash": "b.jpg"}]
+    # Only this batch - the endpoint exists, so the next batch tries it again
+    assert api_client._bulk_import_supported is True
+    api_client.session.calls.clear()
+    api_client.import_photos_batch([_photo("c.jpg")])
+    assert api_client.session.calls[0][1].endswith("/bulk")
+
+
+def test_import_photos_batch_bad_request_fails_batch(api_client):
+    api_client.session.handler = lambda method, url, kwargs: FakeResponse(400)
+
+    results = api_client.import_photos_batch([_photo("a.jpg"), _photo("b.jpg")])
+
+    assert all("400" in result["error"] for result in results)
+    # No per-photo re-posts of a batch the endpoint rejected
+    assert [url for _, url, _ in api_client.session.calls] == ["http://backend/api/v1/photos/new-photo/bulk"]
+
+
+def _multipart_client(api_client, multipart_response):
+    """Client with multipart imports on; multipart posts get multipart_response"""
+    def handler(method, url, kwargs):
+        if "files" in kwargs:
+            return multipart_response
+        return FakeResponse(200, json.dumps({"photo_hothash": _body(kwargs)["filename"]}).encode())
+    api_client.multipart_import = True
+    api_client.session.handler = handler
+    return api_client
+
+
+def _validation_error(*errors):
+    return FakeResponse(422, json.dumps({"detail": list(errors)}).encode())
+
+
+def test_import_photo_sends_multipart(api_client):
+    client = _multipart_client(api_client, FakeResponse(200, b'{"photo_hothash": "h"}'))
+
+    assert client.import_photo("a.jpg", hotpreview_bytes=b"jpeg") == {"photo_hothash": "h"}
+    files = client.session.calls[0][2]["files"]
+    assert files["hotpreview"][1] == b"jpeg"
+    assert json.loads(files["metadata"][1]) == {"filename": "a.jpg"}
+
+
+@pytest.mark.parametrize("response", [
+    FakeResponse(415),
+    _validation_error({"loc": ["body"], "msg": "Input should be a valid dictionary", "type": "model_attributes_type"}),
+    _validation_error({"loc": ["body", "filename"], "msg": "Field required", "type": "missing"}),
+])
+def test_import_photo_disables_rejected_multipart(api_client, response):
+    client = _multipart_client(api_client, response)
+
+    assert client.import_photo("a.jpg", hotpreview_bytes=b"jpeg") == {"photo_hothash": "a.jpg"}
+    assert client.multipart_import is False
+    resent = _body(client.session.calls[1][2])
+    assert base64.b64decode(resent["hotpreview"]) == b"jpeg"
+
+
+def test_import_photo_keeps_multipart_on_other_validation_errors(api_client):
+    client = _multipart_client(api_client, _validation_error(
+        {"loc": ["body", "taken_at"], "msg": "Input should be a valid datetime", "type": "datetime_parsing"}))
+
+    assert client.import_photo("a.jpg", hotpreview_base64="aG90", hotpreview_bytes=b"hot",
+                               taken_at="not a date") == {"photo_hothash": "a.jpg"}
+    assert client.multipart_import is True
+    assert "files" not in client.session.calls[1][2]
+    assert _body(client.session.calls[1][2])["hotpreview"] == "aG90"
+
+
+def _preview_server(method, url, kwargs):
+    """Preview endpoints answering with the hothash (plus size params)"""
+    hothash = url.split("/")[-2]
+    size = "x".join(str(kwargs.get("params", {}).get(k, 0)) for k in ("width", "height"))
+    return FakeResponse(200, f"{hothash}:{size}".encode())
+
+
+def test_hotpreview_cache_is_bounded_lru(api_client, monkeypatch):
+    from src.api import client as client_module
+    monkeypatch.setattr(client_module, "HOTPREVIEW_CACHE_SIZE", 3)
+    api_client.session.handler = _preview_server
+
+    for hothash in ("a", "b", "c"):
+        api_client.get_hotpreview(hothash)
+    api_client.get_hotpreview("a")  # Now most recently used
+    api_client.get_hotpreview("d")  # Evicts b
+    assert len(api_client._hotpreviews) == 3
+
+    api_client.session.calls.clear()
+    for hothash in ("a", "c", "d"):
+        assert api_client.get_hotpreview(hothash).startswith(hothash.encode())
+    assert api_client.session.calls == []
+    api_client.get_hotpreview("b")
+    assert len(api_client.session.calls) == 1
+
+
+def test_hotpreview_cache_cleared(api_client):
+    api_client.session.handler = _preview_server
+    api_client.get_hotpreview("a")
+
+    api_client.clear_thumbnail_cache()
+    api_client.get_hotpreview("a")
+
+    assert len(api_client.session.calls) == 2
+
+
+def test_coldpreview_cache_is_bounded_by_bytes(api_client, monkeypatch):
+    from src.api import client as client_module
+    monkeypatch.setattr(client_module, "COLDPREVIEW_CACHE_BYTES", 20)
+    api_client.session.handler = _preview_server  # Responses are 6-7 bytes
+
+    api_client.get_coldpreview("a")
+    api_client.get_coldpreview("b")
+    api_client.get_coldpreview("a", 100, 100)
+    api_client.get_coldpreview("a")  # Most recently used
+    api_client.get_coldpreview("c")  # Evicts b
+
+    assert list(api_client._coldpreviews) == [("a", 100, 100), ("a", None, None), ("c", None, None)]
+    assert api_client._coldpreviews_size == sum(map(len, api_client._coldpreviews.values())) <= 20
+
+
+def test_coldpreview_cache_keeps_oversized_latest_entry(api_client, monkeypatch):
+    from src.api import client as client_module
+    monkeypatch.setattr(client_module, "COLDPREVIEW_CACHE_BYTES", 4)
+    api_client.session.handler = _preview_server
+
+    api_client.get_coldpreview("a")
+    api_client.get_coldpreview("b")
+
+    assert list(api_client._coldpreviews) == [("b", None, None)]
+    assert api_client._coldpreviews_size == len(b"b:0x0")
+
+
+def test_coldpreview_invalidate_updates_size(api_client):
+    api_client.session.handler = _preview_server
+    api_client.get_coldpreview("a")
+    api_client.get_coldpreview("a", 100, 100)
+    api_client.get_coldpreview("b")
+
+    api_client.invalidate_coldpreview("a")
+
+    assert list(api_client._coldpreviews) == [("b", None, None)]
+    assert api_client._coldpreviews_size == len(b"b:0x0")
+    api_client.clear_thumbnail_cache()
+    assert api_client._coldpreviews_size == 0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the client module"""
+    from src.api import client as client_module
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_current_user_cached_for_ttl(api_client, clock):
+    from src.api.client import CURRENT_USER_TTL
+    api_client.session.handler = lambda method, url, kwargs: FakeResponse(
+        200, json.dumps({"request": len(api_client.session.calls)}).encode())
+
+    assert api_client.get_current_user() == {"request": 1}
+    clock[0] += CURRENT_USER_TTL - 1
+    assert api_client.get_current_user() == {"request": 1}
+    clock[0] += 1
+    assert api_client.get_current_user() == {"request": 2}
+    assert [url for _, url, _ in api_client.session.calls] == ["http://backend/api/v1/auth/me"] * 2
+
+
+def test_current_user_cache_dropped_on_token_change(api_client, clock):
+    api_client.session.handler = lambda method, url, kwargs: FakeResponse(
+        200, json.dumps({"request": len(api_client.session.calls)}).encode())
+
+    api_client.get_current_user()
+    api_client.set_token("other")
+    assert api_client.get_current_user() == {"request": 2}
+    api_client.clear_token()
+    assert api_client.get_current_user() == {"request": 3}
+
+
+def test_current_user_cache_is_not_shared_with_callers(api_client, clock):
+    api_client.session.handler = lambda method, url, kwargs: FakeResponse(
+        200, b'{"username": "u", "roles": ["viewer"]}')
+
+    first = api_client.get_current_user()
+    first["username"] = "changed"
+    first["roles"].append("admin")
+    second = api_client.get_current_user()
+    second["username"] = "changed again"
+
+    assert api_client.get_current_user() == {"username": "u", "roles": ["viewer"]}
+    assert len(api_client.session.calls) == 1
+
+
+def test_current_user_errors_are_not_cached(api_client, clock):
+    import requests
+    responses = [FakeResponse(401), FakeResponse(200, b'{"username": "u"}')]
+    api_client.session.handler = lambda method, url, kwargs: responses.pop(0)
+
+    with pytest.raises(requests.HTTPError):
+        api_client.get_current_user()
+    assert api_client.get_current_user() == {"username": "u"}
+
+
+@pytest.mark.parametrize("header, expected", [("600", 5.0), ("2", 2.0), (None, None)])
+def test_retry_after_is_capped(header, expected):
+    from urllib3 import HTTPResponse
+    from src.api.client import APIClient
+
+    client = APIClient("http://backend", http2=False)
+    retry = client.session.get_adapter("http://backend").max_retries
+    response = HTTPResponse(status=503, headers={"Retry-After": header} if header else {})
+
+    assert retry.get_retry_after(response) == expected
+    # Retry state kept across attempts keeps the cap
+    assert retry.increment("GET", "/x", response=response).get_retry_after(response) == expected
+
+
+def test_existing_hothashes_reports_progress(api_client):
+    def handler(method, url, kwargs):
+        if url.endswith("/exists-batch"):
+            return FakeResponse(200, b'{"exists": ["b"]}')
+        raise AssertionError(url)
+    api_client.session.handler = handler
+    progress = []
+
+    assert api_client.existing_hothashes(["a", "b"], progress_callback=progress.append) == {"b"}
+    assert progress == [2]
+
+
+def test_existing_hothashes_fallback_reports_progress(api_client):
+    def handler(method, url, kwargs):
+        if url.endswith("/exists-batch"):
+            return FakeResponse(404)
+        return FakeResponse(200 if url.endswith("/b") else 404)
+    api_client.session.handler = handler
+    progress = []
+
+    assert api_client.existing_hothashes(["a", "b", "c"], progress_callback=progress.append) == {"b"}
+    assert progress == [1, 2, 3]
+
+
+@pytest.fixture
+def connect_attempts(monkeypatch):
+    """Count urllib3 connection attempts, each refused without touching the network"""
+    from urllib3.util import connection, retry
+    attempts = []
+
+    def refuse(address, *args, **kwargs):
+        attempts.append(address)
+        raise ConnectionRefusedError("refused")
+    monkeypatch.setattr(connection, "create_connection", refuse)
+    monkeypatch.setattr(retry.time, "sleep", lambda seconds: None)  # Skip backoff
+    return attempts
+
+
+@pytest.mark.parametrize("call", [
+    lambda client: client.login("user", "password"),
+    lambda client: client.register("user", "user@example.com", "password", "User"),
+])
+def test_login_and_register_are_not_retried(connect_attempts, call):
+    import requests
+    from src.api.client import APIClient
+    client = APIClient("http://backend", http2=False)
+
+    with pytest.raises(requests.ConnectionError):
+        call(client)
+    assert len(connect_attempts) == 1
+
+    # Other requests still retry failed connections
+    connect_attempts.clear()
+    with pytest.raises(requests.ConnectionError):
+        client.get_photos()
+    assert len(connect_attempts) == 4
+
+
+def test_circuit_opens_after_threshold_connect_attempts(connect_attempts):
+    import requests
+    from src.api.circuit_breaker import CircuitBreaker, CircuitOpenError
+    from src.api.client import APIClient
+    client = APIClient("http://backend", http2=False)
+
+    # Every failed attempt counts - the retries of one call can open the circuit
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            client.get_photos()
+    assert len(connect_attempts) == client.breaker.failure_threshold
+    assert client.breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        client.get_photos()
+    assert len(connect_attempts) == client.breaker.failure_threshold
+
+
+def test_read_timeout_is_not_retried():
+    import socket
+    import requests
+    from src.api.client import APIClient
+
+    # Accepts connections but never answers
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    try:
+        client = APIClient(f"http://127.0.0.1:{server.getsockname()[1]}", http2=False, timeout=0.2)
+        with pytest.raises(requests.ReadTimeout):
+            client.get_photos()
+
+        server.settimeout(0)
+        accepted = []
+        while True:
+            try:
+                accepted.append(server.accept()[0])
+            except BlockingIOError:
+                break
+        assert len(accepted) == 1
+        for conn in accepted:
+            conn.close()
+    finally:
+        server.close()
+
+
+@pytest.fixture
+def unavailable_backend(monkeypatch):
+    """Local HTTP server answering every request with 503, returns (url, hits)"""
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from urllib3.util import retry
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(retry.time, "sleep", lambda seconds: None)  # Skip backoff
+    yield f"http://127.0.0.1:{server.server_address[1]}", hits
+    server.shutdown()
+    server.server_close()
+
+
+def _count_failures(monkeypatch, breaker):
+    failures = []
+    record_failure = breaker.record_failure
+    monkeypatch.setattr(breaker, "record_failure", lambda: (failures.append(1), record_failure()))
+    return failures
+
+
+def test_each_failed_attempt_is_recorded_once(monkeypatch, connect_attempts):
+    import requests
+    from src.api.client import APIClient
+    client = APIClient("http://backend", http2=False)
+    client.breaker.failure_threshold = 100
+    failures = _count_failures(monkeypatch, client.breaker)
+
+    with pytest.raises(requests.ConnectionError):
+        client.get_photos()
+    assert len(failures) == len(connect_attempts) == 4
+
+    # Including the attempt that opens the circuit
+    failures.clear()
+    connect_attempts.clear()
+    client.breaker.record_success()
+    client.breaker.failure_threshold = 2
+    with pytest.raises(requests.ConnectionError):
+        client.get_photos()
+    assert len(failures) == len(connect_attempts) == 2
+
+
+def test_each_unavailable_response_is_recorded_once(monkeypatch, unavailable_backend):
+    import requests
+    from src.api.client import APIClient
+    url, hits = unavailable_backend
+    client = APIClient(url, http2=False)
+    client.breaker.failure_threshold = 100
+    failures = _count_failures(monkeypatch, client.breaker)
+
+    with pytest.raises(requests.HTTPError):
+        client.get_photos()
+    assert len(failures) == len(hits) == 4
+
+    failures.clear()
+    hits.clear()
+    client.breaker.record_success()
+    client.breaker.failure_threshold = 2
+    with pytest.raises(requests.HTTPError):
+        client.get_photos()
+    assert len(failures) == len(hits) == 2
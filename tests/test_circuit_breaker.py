@@ -0,0 +1,107 @@
+"""Tests for the APIClient circuit breaker (fake clock)"""
+import pytest
+
+from src.api import circuit_breaker
+from src.api.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the breaker module"""
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _open(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.before_request()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_probe_closes_on_success(clock):
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    _open(breaker)
+
+    clock[0] += 9.9
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    clock[0] += 0.1
+    breaker.before_request()  # The probe
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()  # Only one probe at a time
+
+    breaker.record_response(200)
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_request()
+
+
+def test_half_open_probe_failure_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    _open(breaker)
+
+    clock[0] += 10
+    breaker.before_request()
+    breaker.record_response(503)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Recovery timeout restarts from the failed probe
+    clock[0] += 5
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    clock[0] += 5
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_failures_while_open_keep_recovery_time(clock):
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+    _open(breaker)
+
+    # Requests that were in flight when the circuit opened fail later
+    clock[0] += 5
+    breaker.record_failure()
+
+    clock[0] += 5
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+@pytest.mark.parametrize("status, opens", [(502, True), (503, True), (504, True), (408, True),
+                                           (200, False), (404, False), (500, False)])
+def test_record_response_statuses(clock, status, opens):
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    breaker.record_response(status)
+
+    assert (breaker.state == CircuitBreaker.OPEN) is opens
+
+
+def test_circuit_open_error_is_a_connection_error():
+    import requests
+    assert issubclass(CircuitOpenError, requests.exceptions.ConnectionError)
@@ -0,0 +1,84 @@
+"""Tests for the persistent file path -> hothash cache"""
+import json
+import os
+
+from src.services.hothash_cache import HothashCache
+
+
+def _file(tmp_path, name, content=b"jpeg"):
+    path = tmp_path / name
+    path.write_bytes(content)
+    st = os.stat(path)
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+def test_lookup_returns_unchanged_files_only(tmp_path):
+    cache = HothashCache(str(tmp_path / "config"))
+    a, a_mtime, a_size = _file(tmp_path, "a.jpg")
+    b, b_mtime, b_size = _file(tmp_path, "b.jpg")
+    c, _, _ = _file(tmp_path, "c.jpg")
+    cache.set(a, a_mtime, a_size, "hash-a")
+    cache.set(b, b_mtime, b_size, "hash-b")
+
+    # Changed after caching
+    with open(b, "ab") as f:
+        f.write(b"more")
+
+    assert cache.lookup([a, b, c, str(tmp_path / "missing.jpg")]) == {a: "hash-a"}
+
+
+def test_lookup_ignores_deleted_files(tmp_path):
+    cache = HothashCache(str(tmp_path / "config"))
+    a, mtime, size = _file(tmp_path, "a.jpg")
+    cache.set(a, mtime, size, "hash-a")
+    os.remove(a)
+
+    assert cache.lookup([a]) == {}
+
+
+def test_set_ignores_incomplete_entries(tmp_path):
+    cache = HothashCache(str(tmp_path / "config"))
+    a, mtime, size = _file(tmp_path, "a.jpg")
+
+    cache.set(a, None, size, "hash-a")
+    cache.set(a, mtime, size, "")
+    cache.save()
+
+    assert cache.lookup([a]) == {}
+    assert not os.path.exists(cache.cache_file)
+
+
+def test_save_and_reload(tmp_path):
+    config_dir = str(tmp_path / "config")
+    cache = HothashCache(config_dir)
+    a, mtime, size = _file(tmp_path, "a.jpg")
+    cache.set(a, mtime, size, "hash-a")
+    cache.save()
+
+    with open(cache.cache_file, encoding="utf-8") as f:
+        assert json.load(f) == {"version": "1.0", "files": {a: [mtime, size, "hash-a"]}}
+    assert not os.path.exists(cache.cache_file + ".tmp")
+    assert HothashCache(config_dir).lookup([a]) == {a: "hash-a"}
+
+
+def test_save_skips_unchanged_cache(tmp_path):
+    config_dir = str(tmp_path / "config")
+    cache = HothashCache(config_dir)
+    a, mtime, size = _file(tmp_path, "a.jpg")
+    cache.set(a, mtime, size, "hash-a")
+    cache.save()
+    os.remove(cache.cache_file)
+
+    cache.save()
+
+    assert not os.path.exists(cache.cache_file)
+
+
+def test_unreadable_cache_file_starts_empty(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "hothashes.json").write_text("{not json")
+
+    cache = HothashCache(str(config_dir))
+
+    assert cache.lookup([str(tmp_path / "a.jpg")]) == {}
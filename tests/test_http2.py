@@ -0,0 +1,87 @@
+"""Tests for the optional httpx-backed HTTP2Session"""
+import json
+
+import pytest
+import requests
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from src.api.circuit_breaker import CircuitBreaker  # noqa: E402
+from src.api.http2 import HTTP2Session  # noqa: E402
+
+
+def _session(handler, breaker=None):
+    """HTTP2Session sending requests to handler(httpx.Request) instead of the network"""
+    session = HTTP2Session(4, (1.0, 1.0), breaker)
+    session._client.close()
+    session._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return session
+
+
+def _echo(request):
+    return httpx.Response(200, json={"method": request.method, "body": request.content.decode()})
+
+
+@pytest.mark.parametrize("method", ["get", "head", "post", "put", "patch", "delete"])
+def test_session_methods(method):
+    session = _session(_echo)
+
+    response = getattr(session, method)("http://backend/x")
+
+    assert response.status_code == 200
+    if method != "head":
+        assert json.loads(response.content)["method"] == method.upper()
+
+
+@pytest.mark.parametrize("method", ["post", "put", "patch"])
+def test_bytes_data_is_sent_as_body(method):
+    session = _session(_echo)
+
+    response = getattr(session, method)("http://backend/x", data=b'{"a": 1}')
+
+    assert json.loads(response.content)["body"] == '{"a": 1}'
+
+
+def test_raise_for_status_raises_requests_http_error():
+    session = _session(lambda request: httpx.Response(409, text="already exists"))
+
+    response = session.post("http://backend/x", data=b"{}")
+
+    with pytest.raises(requests.exceptions.HTTPError) as info:
+        response.raise_for_status()
+    assert info.value.response.status_code == 409
+    assert str(info.value).startswith("409 Client Error")
+
+
+def test_raise_for_status_accepts_success_and_redirects():
+    for status in (200, 204, 304):
+        _session(lambda request, status=status: httpx.Response(status)).get("http://backend/x").raise_for_status()
+
+
+@pytest.mark.parametrize("error, expected", [
+    (httpx.ConnectError("refused"), requests.exceptions.ConnectionError),
+    (httpx.ConnectTimeout("slow"), requests.exceptions.ConnectTimeout),
+    (httpx.ReadTimeout("slow"), requests.exceptions.ReadTimeout),
+])
+def test_transport_errors_are_requests_exceptions(error, expected):
+    def handler(request):
+        raise error
+    breaker = CircuitBreaker(failure_threshold=1)
+    session = _session(handler, breaker)
+
+    with pytest.raises(expected):
+        session.get("http://backend/x")
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_api_client_patch_over_http2():
+    from src.api.client import APIClient
+
+    client = APIClient("http://backend", http2=True)
+    client.session = _session(_echo)
+
+    result = client.update_import_session(3, status="completed")
+
+    assert result["method"] == "PATCH"
+    assert json.loads(result["body"]) == {"status": "completed"}
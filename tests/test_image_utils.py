@@ -0,0 +1,48 @@
+"""Tests for src.utils.image_utils.scan_directory_for_images"""
+import os
+
+from src.utils import image_utils
+from src.utils.image_utils import scan_directory_for_images
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"")
+
+
+def test_scan_finds_images_recursively(tmp_path):
+    _touch(str(tmp_path / "a.jpg"))
+    _touch(str(tmp_path / "sub" / "b.JPG"))
+    _touch(str(tmp_path / "sub" / "notes.txt"))
+
+    result = scan_directory_for_images(str(tmp_path))
+
+    assert result == sorted([str(tmp_path / "a.jpg"), str(tmp_path / "sub" / "b.JPG")])
+
+
+def test_scan_skips_unreadable_directory(tmp_path, monkeypatch):
+    _touch(str(tmp_path / "a.jpg"))
+    _touch(str(tmp_path / "lost+found" / "hidden.jpg"))
+    _touch(str(tmp_path / "photos" / "b.jpg"))
+
+    real_scandir = os.scandir
+    blocked = str(tmp_path / "lost+found")
+
+    def fake_scandir(path):
+        if os.fspath(path) == blocked:
+            raise PermissionError(13, "Permission denied", blocked)
+        return real_scandir(path)
+
+    monkeypatch.setattr(image_utils.os, "scandir", fake_scandir)
+
+    result = scan_directory_for_images(str(tmp_path))
+
+    assert result == sorted([str(tmp_path / "a.jpg"), str(tmp_path / "photos" / "b.jpg")])
+
+
+def test_scan_non_recursive(tmp_path):
+    _touch(str(tmp_path / "a.jpg"))
+    _touch(str(tmp_path / "sub" / "b.jpg"))
+
+    assert scan_directory_for_images(str(tmp_path), recursive=False) == [str(tmp_path / "a.jpg")]
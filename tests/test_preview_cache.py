@@ -0,0 +1,169 @@
+"""Tests for src.api.preview_cache.PreviewDiskCache and ETag revalidation"""
+import os
+import threading
+
+from src.api import preview_cache
+from src.api.preview_cache import PreviewDiskCache
+
+from conftest import FakeResponse
+
+
+def test_put_get_roundtrip(tmp_path):
+    cache = PreviewDiskCache(str(tmp_path))
+    assert cache.get("aa", 1920, 1080) is None
+
+    cache.put("aa", 1920, 1080, '"v1"', b"jpeg")
+
+    assert cache.get("aa", 1920, 1080) == ('"v1"', b"jpeg")
+    assert cache.get("aa", None, None) is None  # Sizes are separate entries
+
+
+def test_invalidate_removes_only_that_photo(tmp_path):
+    cache = PreviewDiskCache(str(tmp_path))
+    cache.put("aa", 1920, 1080, '"1"', b"x")
+    cache.put("aa", None, None, '"2"', b"y")
+    cache.put("bb", None, None, '"3"', b"z")
+
+    cache.invalidate("aa")
+    cache.invalidate("never-cached")  # No-op
+
+    assert cache.get("aa", 1920, 1080) is None
+    assert cache.get("aa", None, None) is None
+    assert cache.get("bb", None, None) == ('"3"', b"z")
+    assert not os.path.exists(tmp_path / "aa")
+
+
+def test_invalidate_does_not_list_cache_dir(tmp_path, monkeypatch):
+    cache = PreviewDiskCache(str(tmp_path))
+    for i in range(20):
+        cache.put(f"h{i}", None, None, '"e"', b"x")
+
+    listed = []
+    real_scandir = os.scandir
+
+    def tracking_scandir(path):
+        listed.append(os.fspath(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(preview_cache.os, "scandir", tracking_scandir)
+    cache.invalidate("h3")
+
+    assert str(tmp_path) not in listed
+
+
+def test_prune_removes_least_recently_used(tmp_path):
+    cache = PreviewDiskCache(str(tmp_path), max_bytes=25)
+    for i, hothash in enumerate(["old", "mid", "new"]):
+        cache.put(hothash, None, None, '"e"', b"x" * 10)
+        path = cache._path(hothash, None, None)
+        os.utime(path, (1000 + i, 1000 + i))
+
+    cache.prune()
+
+    assert cache.get("old", None, None) is None
+    assert cache.get("mid", None, None) is not None
+    assert cache.get("new", None, None) is not None
+
+
+def test_prune_keeps_cache_within_bound(tmp_path):
+    cache = PreviewDiskCache(str(tmp_path), max_bytes=0)
+    cache.put("aa", None, None, '"e"', b"x")
+    cache.prune()
+    assert os.listdir(tmp_path) == []
+
+
+def test_write_counter_is_thread_safe(tmp_path, monkeypatch):
+    monkeypatch.setattr(preview_cache, "PRUNE_INTERVAL", 10)
+    cache = PreviewDiskCache(str(tmp_path))
+    prunes = []
+    cache.prune = lambda: prunes.append(1)
+
+    def writer(n):
+        for i in range(25):
+            cache.put(f"t{n}-{i}", None, None, '"e"', b"x")
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert cache._writes == 100
+    assert len(prunes) == 10
+
+
+def test_get_coldpreview_revalidates_with_etag(api_client):
+    responses = [
+        FakeResponse(200, b"cold-v1", {"ETag": '"v1"'}),
+        FakeResponse(304),
+    ]
+    api_client.session.handler = lambda method, url, kwargs: responses.pop(0)
+
+    assert api_client.get_coldpreview("aa", 1920, 1080) == b"cold-v1"
+    # New process: memory cache is empty, disk entry remains
+    api_client._coldpreviews.clear()
+    assert api_client.get_coldpreview("aa", 1920, 1080) == b"cold-v1"
+
+    first, second = api_client.session.calls
+    assert "If-None-Match" not in first[2]["headers"]
+    assert second[2]["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_get_coldpreview_replaces_changed_preview(api_client):
+    api_client._coldpreview_disk.put("aa", None, None, '"v1"', b"cold-v1")
+    api_client.session.handler = lambda method, url, kwargs: FakeResponse(
+        200, b"cold-v2", {"ETag": '"v2"'}
+    )
+
+    assert api_client.get_coldpreview("aa") == b"cold-v2"
+    assert api_client._coldpreview_disk.get("aa") == ('"v2"', b"cold-v2")
+
+
+def test_get_coldpreview_without_etag_is_not_persisted(api_client):
+    api_client.session.handler = lambda method, url, kwargs: FakeResponse(200, b"cold")
+
+    assert api_client.get_coldpreview("aa") == b"cold"
+    assert api_client._coldpreview_disk.get("aa") is None
+
+
+def test_clear_removes_everything(tmp_path):
+    cache = PreviewDiskCache(str(tmp_path))
+    cache.put("aa", 1920, 1080, '"1"', b"x")
+    cache.put("bb", None, None, '"2"', b"y")
+
+    cache.clear()
+
+    assert os.listdir(tmp_path) == []
+    PreviewDiskCache(str(tmp_path / "missing")).clear()  # No cache dir yet
+
+
+def test_logout_drops_coldpreviews_on_disk_and_in_memory(api_client):
+    api_client.set_token("user-a")
+    api_client.session.handler = lambda method, url, kwargs: FakeResponse(
+        200, b"private", {"ETag": '"v1"'}
+    )
+    api_client.get_coldpreview("aa")
+    api_client.get_hotpreview("aa")
+
+    api_client.logout()
+
+    assert api_client._coldpreviews == {} and api_client._hotpreviews == {}
+    assert api_client._coldpreview_disk.get("aa") is None
+
+    # Next account revalidates nothing from the previous one
+    api_client.set_token("user-b")
+    api_client.session.calls.clear()
+    api_client.get_coldpreview("aa")
+    assert "If-None-Match" not in api_client.session.calls[0][2]["headers"]
+
+
+def test_clear_token_keeps_disk_cache(api_client):
+    # Runs whenever the saved token cannot be verified, e.g. backend down
+    api_client._coldpreview_disk.put("aa", None, None, '"v1"', b"cold")
+    api_client.session.handler = lambda method, url, kwargs: FakeResponse(200, b"cold", {"ETag": '"v1"'})
+    api_client.get_coldpreview("bb")
+
+    api_client.clear_token()
+
+    assert api_client._coldpreviews == {}
+    assert api_client._coldpreview_disk.get("aa") is not None
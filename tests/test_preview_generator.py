@@ -0,0 +1,103 @@
+"""Tests for src.utils.preview_generator (hotpreview bytes decide the hothash)"""
+import hashlib
+from io import BytesIO
+
+import pytest
+from PIL import Image, ImageOps
+
+from src.utils.preview_generator import generate_hotpreview_and_hash, generate_previews
+
+ORIENTATION = 0x0112
+
+
+def _pattern(mode, size=(400, 300)):
+    """Image with enough detail that resampling or colour changes show up in the JPEG"""
+    bands = [
+        Image.linear_gradient("L").resize(size),
+        Image.effect_noise(size, 64),
+        Image.linear_gradient("L").rotate(90).resize(size),
+    ]
+    return Image.merge("RGB", bands).convert(mode)
+
+
+def _exif_rotated(path):
+    exif = Image.Exif()
+    exif[ORIENTATION] = 6
+    _pattern("RGB").save(path, "JPEG", quality=95, exif=exif.tobytes())
+
+
+def _cmyk(path):
+    _pattern("CMYK").save(path, "JPEG", quality=95)
+
+
+def _rgba(path):
+    img = _pattern("RGBA")
+    img.putalpha(Image.linear_gradient("L").resize(img.size))
+    img.save(path, "PNG")
+
+
+def _palette(path):
+    _pattern("RGB").quantize(64).save(path, "PNG")
+
+
+def _plain(path):
+    _pattern("RGB", size=(1600, 1200)).save(path, "JPEG", quality=95)
+
+
+def _reference_hotpreview(path):
+    """Full decode -> exif_transpose -> thumbnail -> JPEG q85"""
+    img = Image.open(path)
+    img.load()
+    img = ImageOps.exif_transpose(img)
+    img.thumbnail((150, 150), Image.Resampling.LANCZOS)
+    buffer = BytesIO()
+    img.convert("RGB").save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+@pytest.fixture(params=[
+    ("rotated.jpg", _exif_rotated),
+    ("cmyk.jpg", _cmyk),
+    ("rgba.png", _rgba),
+    ("palette.png", _palette),
+    ("plain.jpg", _plain),
+], ids=lambda param: param[0])
+def image_path(request, tmp_path):
+    name, write = request.param
+    path = tmp_path / name
+    write(str(path))
+    return str(path)
+
+
+def test_hotpreview_matches_reference_pipeline(image_path):
+    hotpreview, hotpreview_b64, hothash = generate_hotpreview_and_hash(image_path)
+
+    assert hotpreview == _reference_hotpreview(image_path)
+    assert hothash == hashlib.sha256(hotpreview).hexdigest()
+
+
+def test_generate_previews_matches_hotpreview_and_hash(image_path):
+    previews = generate_previews(image_path)
+
+    assert previews[:3] == generate_hotpreview_and_hash(image_path)
+
+
+def test_generate_previews_coldpreview_is_oriented_and_bounded(image_path):
+    coldpreview = Image.open(BytesIO(generate_previews(image_path, cold_max_size=200)[3]))
+    reference = ImageOps.exif_transpose(Image.open(image_path))
+    scale = min(200 / reference.width, 200 / reference.height, 1.0)
+
+    assert coldpreview.format == "JPEG"
+    assert coldpreview.mode == "RGB"
+    assert coldpreview.size == (round(reference.width * scale), round(reference.height * scale))
+
+
+def test_exif_rotation_is_applied_to_pixels(tmp_path):
+    path = str(tmp_path / "rotated.jpg")
+    _exif_rotated(path)
+
+    hotpreview = Image.open(BytesIO(generate_hotpreview_and_hash(path)[0]))
+
+    # 400x300 stored, Orientation=6 -> portrait, no EXIF left in the preview
+    assert hotpreview.size == (112, 150)
+    assert ORIENTATION not in hotpreview.getexif()
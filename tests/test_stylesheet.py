@@ -0,0 +1,116 @@
+"""Tests for stylesheet minification and the minified stylesheet cache"""
+import os
+
+import pytest
+
+from src.ui import stylesheet
+
+
+SOURCE = """
+/* Main window */
+QMainWindow {
+    background: #202020;
+}
+
+QPushButton:hover,  QToolButton > QLabel {
+    color : white;
+}
+"""
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    """Source stylesheet in tmp_path, with the cache in tmp_path/cache"""
+    path = tmp_path / "main.qss"
+    path.write_text(SOURCE)
+    cache_path = tmp_path / "cache" / stylesheet._CACHE_FILENAME
+    monkeypatch.setattr(stylesheet, "_cache_path", lambda: cache_path)
+    return path
+
+
+def test_minify_stylesheet():
+    assert stylesheet.minify_stylesheet(SOURCE) == (
+        "QMainWindow{background: #202020;}"
+        "QPushButton:hover,QToolButton>QLabel{color : white;}"
+    )
+
+
+def test_source_is_cached_with_mtime_and_size(source):
+    expected = stylesheet.minify_stylesheet(SOURCE)
+
+    assert stylesheet._load_source_cached(source) == expected
+
+    cache_path = stylesheet._cache_path()
+    data = cache_path.read_bytes()
+    st = source.stat()
+    assert data[:stylesheet._CACHE_HEADER.size] == stylesheet._CACHE_HEADER.pack(
+        stylesheet.MINIFY_VERSION, st.st_mtime_ns, st.st_size)
+    assert data[stylesheet._CACHE_HEADER.size:].decode("utf-8") == expected
+    assert not cache_path.with_suffix(".tmp").exists()
+
+
+def test_cache_is_used_while_source_is_unchanged(source):
+    stylesheet._load_source_cached(source)
+    cache_path = stylesheet._cache_path()
+    header = cache_path.read_bytes()[:stylesheet._CACHE_HEADER.size]
+    cache_path.write_bytes(header + b"QWidget{}")
+
+    assert stylesheet._load_source_cached(source) == "QWidget{}"
+
+
+def test_damaged_cache_is_rebuilt(source):
+    stylesheet._load_source_cached(source)
+    cache_path = stylesheet._cache_path()
+    header = cache_path.read_bytes()[:stylesheet._CACHE_HEADER.size]
+    cache_path.write_bytes(header + b"\xff\xfe")
+
+    assert stylesheet._load_source_cached(source) == stylesheet.minify_stylesheet(SOURCE)
+    assert stylesheet._load_source_cached(source) == stylesheet.minify_stylesheet(SOURCE)
+
+
+def test_unreadable_cache_is_ignored(source, monkeypatch):
+    stylesheet._load_source_cached(source)
+    real_read_bytes = type(source).read_bytes
+
+    def read_bytes(path):
+        if path == stylesheet._cache_path():
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_read_bytes(path)
+
+    monkeypatch.setattr(type(source), "read_bytes", read_bytes)
+
+    assert stylesheet._load_source_cached(source) == stylesheet.minify_stylesheet(SOURCE)
+
+
+def test_cache_is_rebuilt_when_source_changes(source):
+    stylesheet._load_source_cached(source)
+    source.write_text("QLabel { color: red; }")
+    st = source.stat()
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert stylesheet._load_source_cached(source) == "QLabel{color: red;}"
+    assert stylesheet._cache_path().read_bytes().endswith(b"QLabel{color: red;}")
+
+
+def test_cache_is_rebuilt_when_minifier_changes(source, monkeypatch):
+    stylesheet._load_source_cached(source)
+    cache_path = stylesheet._cache_path()
+    header = cache_path.read_bytes()[:stylesheet._CACHE_HEADER.size]
+    cache_path.write_bytes(header + b"QWidget{}")
+
+    monkeypatch.setattr(stylesheet, "MINIFY_VERSION", stylesheet.MINIFY_VERSION + 1)
+    assert stylesheet._load_source_cached(source) == stylesheet.minify_stylesheet(SOURCE)
+
+
+def test_build_minified(source, tmp_path):
+    target = tmp_path / "main.min.qss"
+
+    stylesheet.build_minified(source, target)
+
+    assert target.read_text() == stylesheet.minify_stylesheet(SOURCE)
+
+
+def test_works_without_cache_dir(source, monkeypatch):
+    monkeypatch.setattr(stylesheet, "_cache_path", lambda: None)
+
+    assert stylesheet._load_source_cached(source) == stylesheet.minify_stylesheet(SOURCE)